@@ -12,10 +12,13 @@ Features:
     - Overrides: Apply attribute modifications per layer
 """
 
-from typing import List, Dict, Optional, Any, Callable, Set
+from typing import List, Dict, Optional, Any, Callable, Set, Pattern
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 import fnmatch
+import os
+import re
 import uuid
 import json
 
@@ -47,6 +50,33 @@ class OverrideType(Enum):
     RELATIVE = "Relative"
 
 
+# =============================================================================
+# Expression Matching
+# =============================================================================
+
+@lru_cache(maxsize=256)
+def compile_expression(expression: str) -> Optional[Pattern[str]]:
+    """
+    Compile a ``;``-separated wildcard expression into a single regex.
+    
+    Each pattern is translated with ``fnmatch.translate`` and the results are
+    OR-ed together, so a prim is tested against the whole expression in one
+    ``match`` call. Compiled patterns are cached per expression string.
+    Case sensitivity follows ``fnmatch.fnmatch`` on the current platform.
+    
+    Args:
+        expression: Wildcard expression, e.g. "*Character* ; *_geo"
+        
+    Returns:
+        Compiled pattern, or None if the expression has no patterns
+    """
+    patterns = [p.strip() for p in expression.split(";") if p.strip()]
+    if not patterns:
+        return None
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns), flags)
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -139,14 +169,12 @@ class Collection:
         matched.update(self.include_paths)
         
         # Add expression-matched paths
-        if self.expression:
-            patterns = [p.strip() for p in self.expression.split(";") if p.strip()]
+        matcher = compile_expression(self.expression) if self.expression else None
+        if matcher:
+            match = matcher.match
             for path in all_paths:
-                prim_name = path.split("/")[-1] if "/" in path else path
-                for pattern in patterns:
-                    if fnmatch.fnmatch(prim_name, pattern) or fnmatch.fnmatch(path, pattern):
-                        matched.add(path)
-                        break
+                if match(path.rsplit("/", 1)[-1]) or match(path):
+                    matched.add(path)
         
         # Remove excluded paths
         matched -= set(self.exclude_paths)
@@ -249,23 +277,13 @@ class RenderLayer:
     
     def find_collection(self, collection_id: str) -> Optional[Collection]:
         """Find a collection by ID (including sub-collections)."""
-        for col in self.collections:
+        # Depth-first with an explicit stack, in the same order as the tree
+        stack = self.collections[::-1]
+        while stack:
+            col = stack.pop()
             if col.id == collection_id:
                 return col
-            # Search in sub-collections recursively
-            found = self._find_in_subcollections(col, collection_id)
-            if found:
-                return found
-        return None
-    
-    def _find_in_subcollections(self, parent: Collection, collection_id: str) -> Optional[Collection]:
-        """Recursively find collection in sub-collections."""
-        for sub in parent.sub_collections:
-            if sub.id == collection_id:
-                return sub
-            found = self._find_in_subcollections(sub, collection_id)
-            if found:
-                return found
+            stack.extend(reversed(col.sub_collections))
         return None
     
     def to_dict(self) -> Dict:
@@ -300,16 +318,12 @@ class RenderLayer:
     def get_all_collection_paths(self) -> Set[str]:
         """Get all paths from all collections in this layer."""
         all_paths = set()
-        for col in self.collections:
-            all_paths.update(self._get_collection_paths_recursive(col))
+        stack = list(self.collections)
+        while stack:
+            col = stack.pop()
+            all_paths.update(col.include_paths)
+            stack.extend(col.sub_collections)
         return all_paths
-    
-    def _get_collection_paths_recursive(self, collection: Collection) -> Set[str]:
-        """Recursively get paths from a collection and its sub-collections."""
-        paths = set(collection.include_paths)
-        for sub in collection.sub_collections:
-            paths.update(self._get_collection_paths_recursive(sub))
-        return paths
 
 
 # =============================================================================
@@ -556,12 +570,13 @@ class RenderSetupManager:
         return False
     
     def _remove_from_subcollections(self, parent: Collection, collection_id: str) -> bool:
-        """Recursively remove collection from sub-collections."""
-        if parent.remove_sub_collection(collection_id):
-            return True
-        for sub in parent.sub_collections:
-            if self._remove_from_subcollections(sub, collection_id):
+        """Remove a collection from anywhere below a parent collection."""
+        stack = [parent]
+        while stack:
+            col = stack.pop()
+            if col.remove_sub_collection(collection_id):
                 return True
+            stack.extend(reversed(col.sub_collections))
         return False
     
     def update_collection(self, collection_id: str, **kwargs) -> bool:
@@ -692,13 +707,13 @@ class RenderSetupManager:
     
     def _find_override_in_collection(self, collection: Collection, override_id: str) -> Optional[Override]:
         """Find an override in a collection tree."""
-        for ovr in collection.overrides:
-            if ovr.id == override_id:
-                return ovr
-        for sub in collection.sub_collections:
-            found = self._find_override_in_collection(sub, override_id)
-            if found:
-                return found
+        stack = [collection]
+        while stack:
+            col = stack.pop()
+            for ovr in col.overrides:
+                if ovr.id == override_id:
+                    return ovr
+            stack.extend(reversed(col.sub_collections))
         return None
     
     def _is_collection_in_active_layer(self, collection_id: str) -> bool:
@@ -7,7 +7,8 @@ ViewModel for the Render Setup feature.
 Manages the interaction between the UI and the RenderSetupManager.
 """
 
-from typing import List, Dict, Optional, Any, Callable
+from types import MappingProxyType
+from typing import List, Dict, Optional, Any, Callable, Tuple, Mapping
 from .base_viewmodel import BaseViewModel
 from ..core.render_setup import (
     RenderSetupManager,
@@ -20,6 +21,87 @@ from ..core.render_setup import (
 )
 
 
+# =============================================================================
+# Static Metadata
+# =============================================================================
+# Built once at import and shared by every caller, so the mappings are
+# read-only and vector defaults are tuples.
+
+AttributeInfo = Mapping[str, Any]
+
+
+def _freeze_attributes(*infos: Dict[str, Any]) -> Tuple[AttributeInfo, ...]:
+    """Freeze attribute info dicts, baking in their "Add Override" button label."""
+    return tuple(
+        MappingProxyType({**info, "button_label": f"+ {info['name']}"})
+        for info in infos
+    )
+
+
+_FILTER_TYPES: Tuple[str, ...] = tuple(ft.value for ft in FilterType)
+_OVERRIDE_TYPES: Tuple[str, ...] = tuple(ot.value for ot in OverrideType)
+
+_VISIBILITY_ATTRIBUTES: Tuple[AttributeInfo, ...] = _freeze_attributes(
+    {
+        "name": "Visible",
+        "path": "visibility",
+        "description": "Object visibility (inherited/invisible)",
+        "default_value": True,
+        "type": "bool"
+    },
+    {
+        "name": "Hidden",
+        "path": "visibility",
+        "description": "Hide object (set to invisible)",
+        "default_value": False,
+        "type": "bool"
+    },
+)
+
+_RENDERING_ATTRIBUTES: Tuple[AttributeInfo, ...] = _freeze_attributes(
+    {
+        "name": "doubleSided",
+        "path": "doubleSided",
+        "description": "Double sided rendering",
+        "default_value": True,
+        "type": "bool"
+    },
+    {
+        "name": "castsShadows",
+        "path": "primvars:castsShadows",
+        "description": "Object casts shadows",
+        "default_value": True,
+        "type": "bool"
+    },
+    {
+        "name": "subdivisionScheme",
+        "path": "subdivisionScheme",
+        "description": "Subdivision scheme (none/catmullClark/loop/bilinear)",
+        "default_value": "none",
+        "type": "string"
+    },
+)
+
+_TRANSFORM_ATTRIBUTES: Tuple[AttributeInfo, ...] = _freeze_attributes(
+    {
+        "name": "Scale",
+        "path": "xformOp:scale",
+        "description": "Object scale",
+        "default_value": (1.0, 1.0, 1.0),
+        "type": "float3"
+    },
+    {
+        "name": "Translate",
+        "path": "xformOp:translate",
+        "description": "Object translation",
+        "default_value": (0.0, 0.0, 0.0),
+        "type": "float3"
+    },
+)
+
+_COMMON_ATTRIBUTES = _VISIBILITY_ATTRIBUTES + _RENDERING_ATTRIBUTES
+
+
 class RenderSetupViewModel(BaseViewModel):
     """
     ViewModel for Render Setup functionality.
@@ -39,6 +121,11 @@ class RenderSetupViewModel(BaseViewModel):
         self._manager: RenderSetupManager = get_render_setup_manager()
         self._data_changed_callbacks: List[Callable[[], None]] = []
         
+        # id lookup indexes, rebuilt lazily after each manager change
+        self._override_index: Dict[str, Tuple[Override, Collection]] = {}
+        self._collection_to_layer: Dict[str, str] = {}
+        self._indexes_dirty = True
+        
         # Subscribe to manager changes
         self._manager.add_change_callback(self._on_manager_change)
     
@@ -58,6 +145,7 @@ class RenderSetupViewModel(BaseViewModel):
     
     def _on_manager_change(self) -> None:
         """Handle manager data change."""
+        self._indexes_dirty = True
         for callback in self._data_changed_callbacks:
             try:
                 callback()
@@ -68,6 +156,47 @@ class RenderSetupViewModel(BaseViewModel):
         """Manually trigger data changed notification."""
         self._on_manager_change()
     
+    # =========================================================================
+    # Lookup Indexes
+    # =========================================================================
+    
+    def _ensure_indexes(self) -> None:
+        """Rebuild the id lookup indexes if the manager changed since the last build."""
+        if not self._indexes_dirty:
+            return
+        
+        override_index: Dict[str, Tuple[Override, Collection]] = {}
+        collection_to_layer: Dict[str, str] = {}
+        for layer in self._manager.layers:
+            stack = list(layer.collections)
+            while stack:
+                collection = stack.pop()
+                collection_to_layer[collection.id] = layer.id
+                for override in collection.overrides:
+                    override_index[override.id] = (override, collection)
+                stack.extend(collection.sub_collections)
+        
+        self._override_index = override_index
+        self._collection_to_layer = collection_to_layer
+        self._indexes_dirty = False
+    
+    def find_override(self, override_id: str) -> Optional[Override]:
+        """Find an override by ID."""
+        self._ensure_indexes()
+        entry = self._override_index.get(override_id)
+        return entry[0] if entry else None
+    
+    def find_collection_for_override(self, override_id: str) -> Optional[str]:
+        """Find the ID of the collection that contains an override."""
+        self._ensure_indexes()
+        entry = self._override_index.get(override_id)
+        return entry[1].id if entry else None
+    
+    def find_layer_for_collection(self, collection_id: str) -> Optional[str]:
+        """Find the ID of the layer that contains a collection."""
+        self._ensure_indexes()
+        return self._collection_to_layer.get(collection_id)
+    
     # =========================================================================
     # Layer Operations
     # =========================================================================
@@ -345,86 +474,34 @@ class RenderSetupViewModel(BaseViewModel):
     # Scene Query
     # =========================================================================
     
-    def get_filter_types(self) -> List[str]:
+    def get_filter_types(self) -> Tuple[str, ...]:
         """Get available filter types."""
-        return [ft.value for ft in FilterType]
+        return _FILTER_TYPES
     
-    def get_override_types(self) -> List[str]:
+    def get_override_types(self) -> Tuple[str, ...]:
         """Get available override types."""
-        return [ot.value for ot in OverrideType]
+        return _OVERRIDE_TYPES
     
-    def get_common_attributes(self) -> List[Dict[str, Any]]:
+    def get_common_attributes(self) -> Tuple[AttributeInfo, ...]:
         """
         Get commonly overridden attributes.
         
         Returns:
-            List of attribute info dicts
+            Tuple of read-only attribute info mappings
         """
-        return self.get_visibility_attributes() + self.get_rendering_attributes()
+        return _COMMON_ATTRIBUTES
     
-    def get_visibility_attributes(self) -> List[Dict[str, Any]]:
+    def get_visibility_attributes(self) -> Tuple[AttributeInfo, ...]:
         """Get visibility-related attributes."""
-        return [
-            {
-                "name": "Visible",
-                "path": "visibility",
-                "description": "Object visibility (inherited/invisible)",
-                "default_value": True,
-                "type": "bool"
-            },
-            {
-                "name": "Hidden",
-                "path": "visibility",
-                "description": "Hide object (set to invisible)",
-                "default_value": False,
-                "type": "bool"
-            },
-        ]
-    
-    def get_rendering_attributes(self) -> List[Dict[str, Any]]:
+        return _VISIBILITY_ATTRIBUTES
+    
+    def get_rendering_attributes(self) -> Tuple[AttributeInfo, ...]:
         """Get rendering-related attributes."""
-        return [
-            {
-                "name": "doubleSided",
-                "path": "doubleSided",
-                "description": "Double sided rendering",
-                "default_value": True,
-                "type": "bool"
-            },
-            {
-                "name": "castsShadows",
-                "path": "primvars:castsShadows",
-                "description": "Object casts shadows",
-                "default_value": True,
-                "type": "bool"
-            },
-            {
-                "name": "subdivisionScheme",
-                "path": "subdivisionScheme",
-                "description": "Subdivision scheme (none/catmullClark/loop/bilinear)",
-                "default_value": "none",
-                "type": "string"
-            },
-        ]
-    
-    def get_transform_attributes(self) -> List[Dict[str, Any]]:
+        return _RENDERING_ATTRIBUTES
+    
+    def get_transform_attributes(self) -> Tuple[AttributeInfo, ...]:
         """Get transform-related attributes."""
-        return [
-            {
-                "name": "Scale",
-                "path": "xformOp:scale",
-                "description": "Object scale",
-                "default_value": [1.0, 1.0, 1.0],
-                "type": "float3"
-            },
-            {
-                "name": "Translate",
-                "path": "xformOp:translate",
-                "description": "Object translation",
-                "default_value": [0.0, 0.0, 0.0],
-                "type": "float3"
-            },
-        ]
+        return _TRANSFORM_ATTRIBUTES
     
     def get_selected_prim_attributes(self) -> List[Dict[str, Any]]:
         """Get attributes from the first selected prim."""
@@ -478,4 +555,6 @@ class RenderSetupViewModel(BaseViewModel):
         """Clean up resources."""
         self._manager.remove_change_callback(self._on_manager_change)
         self._data_changed_callbacks.clear()
+        self._override_index.clear()
+        self._collection_to_layer.clear()
         super().dispose()
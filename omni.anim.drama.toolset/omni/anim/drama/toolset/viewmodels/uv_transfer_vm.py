@@ -13,7 +13,7 @@ UV 传输 ViewModel
 """
 
 import os
-from typing import Optional, Tuple, List, Dict
+from typing import Optional, Tuple, List, Dict, Iterable
 
 from .base_viewmodel import BaseViewModel
 from ..core.stage_utils import get_stage, get_selection_paths
@@ -46,6 +46,8 @@ class UVTransferViewModel(BaseViewModel):
 
         # 批量处理列表: [{"source": str, "target": str}, ...]
         self._pairs_list: List[Dict[str, str]] = []
+        # 列表的显示文本（每行一对），添加时追加，删除/清空时重建
+        self._pairs_text: str = ""
 
         # 数据变更回调
         self._data_changed_callbacks = []
@@ -103,6 +105,11 @@ class UVTransferViewModel(BaseViewModel):
         """获取批量处理列表。"""
         return self._pairs_list
 
+    @property
+    def pairs_display_text(self) -> str:
+        """获取批量处理列表的显示文本（每行一对，空列表为空字符串）。"""
+        return self._pairs_text
+
     @property
     def pairs_count(self) -> int:
         """获取批量处理列表中的对数。"""
@@ -183,6 +190,18 @@ class UVTransferViewModel(BaseViewModel):
         self.log(f"Output path = {self._output_path}")
         self._notify_data_changed()
 
+    def sync_output_path(self, path: str) -> None:
+        """
+        记录输出路径输入框中正在编辑的值。
+
+        不发出数据变化通知：输入框已显示该值，刷新只会重写其他字段
+        （例如还未提交的目标路径）。
+
+        Args:
+            path: 文件路径
+        """
+        self._output_path = path
+
     def get_default_output_path(self) -> str:
         """
         获取默认输出路径。
@@ -333,15 +352,70 @@ class UVTransferViewModel(BaseViewModel):
                 return False
 
         # 添加到列表
-        self._pairs_list.append({
+        pair = {
             "source": self._source_curve,
             "target": self._target_root
-        })
+        }
+        self._pairs_list.append(pair)
+        line = self._format_pair_line(len(self._pairs_list), pair)
+        self._pairs_text = f"{self._pairs_text}\n{line}" if self._pairs_text else line
 
         self.log(f"Added pair #{len(self._pairs_list)}: {self._source_curve} → {self._target_root}")
         self._notify_data_changed()
         return True
 
+    def add_pairs_bulk(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """
+        批量添加 Source-Target 对，全部添加完成后只通知一次。
+
+        Args:
+            pairs: (source, target) 路径对
+
+        Returns:
+            int: 实际添加的对数（跳过空路径和已存在的对）
+        """
+        existing = {(pair["source"], pair["target"]) for pair in self._pairs_list}
+        lines = []
+        for source, target in pairs:
+            if not source or not target or (source, target) in existing:
+                continue
+            existing.add((source, target))
+            pair = {"source": source, "target": target}
+            self._pairs_list.append(pair)
+            lines.append(self._format_pair_line(len(self._pairs_list), pair))
+
+        if not lines:
+            self.log("No new pairs to add.")
+            return 0
+
+        added_text = "\n".join(lines)
+        self._pairs_text = f"{self._pairs_text}\n{added_text}" if self._pairs_text else added_text
+        self.log(f"Added {len(lines)} pairs (total {len(self._pairs_list)}).")
+        self._notify_data_changed()
+        return len(lines)
+
+    def add_selected_targets(self) -> int:
+        """
+        以当前 Source 为源，把选中的每个 prim 作为 Target 加入批量处理列表。
+
+        Returns:
+            int: 实际添加的对数
+        """
+        if not self._source_curve:
+            self.log("Please set Source first.")
+            return 0
+
+        selection = get_selection_paths()
+        if not selection:
+            self.log("Select one or more target roots or BasisCurves (ABC).")
+            return 0
+
+        return self.add_pairs_bulk(
+            (self._source_curve, target)
+            for target in selection
+            if target != self._source_curve
+        )
+
     def remove_pair(self, index: int) -> bool:
         """
         从批量处理列表中移除指定索引的对。
@@ -354,6 +428,8 @@ class UVTransferViewModel(BaseViewModel):
         """
         if 0 <= index < len(self._pairs_list):
             removed = self._pairs_list.pop(index)
+            # 后面的序号会变化，整体重建
+            self._pairs_text = "\n".join(self.get_pairs_display_list())
             self.log(f"Removed pair: {removed['source']} → {removed['target']}")
             self._notify_data_changed()
             return True
@@ -362,6 +438,7 @@ class UVTransferViewModel(BaseViewModel):
     def clear_pairs_list(self) -> None:
         """清空批量处理列表。"""
         self._pairs_list.clear()
+        self._pairs_text = ""
         self.log("Pairs list cleared.")
         self._notify_data_changed()
 
@@ -372,13 +449,18 @@ class UVTransferViewModel(BaseViewModel):
         Returns:
             List[str]: 格式化的字符串列表
         """
-        result = []
-        for i, pair in enumerate(self._pairs_list):
-            # 简化路径显示
-            src_name = pair["source"].split("/")[-1] if "/" in pair["source"] else pair["source"]
-            tgt_name = pair["target"].split("/")[-1] if "/" in pair["target"] else pair["target"]
-            result.append(f"{i+1}. {src_name} → {tgt_name}")
-        return result
+        return [
+            self._format_pair_line(i + 1, pair)
+            for i, pair in enumerate(self._pairs_list)
+        ]
+
+    @staticmethod
+    def _format_pair_line(number: int, pair: Dict[str, str]) -> str:
+        """格式化列表中的一行（序号从 1 开始）。"""
+        # 简化路径显示
+        src_name = pair["source"].split("/")[-1] if "/" in pair["source"] else pair["source"]
+        tgt_name = pair["target"].split("/")[-1] if "/" in pair["target"] else pair["target"]
+        return f"{number}. {src_name} → {tgt_name}"
 
     # =========================================================================
     # 批量处理：执行烘焙
@@ -486,4 +568,5 @@ class UVTransferViewModel(BaseViewModel):
         self._target_root = ""
         self._output_path = ""
         self._pairs_list.clear()
+        self._pairs_text = ""
         super().dispose()
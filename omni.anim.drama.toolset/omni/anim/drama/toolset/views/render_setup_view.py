@@ -11,7 +11,10 @@ Layout:
     - Right: Property Editor for selected item
 """
 
-from typing import Optional, List, Dict, Any
+from functools import partial
+from typing import Optional, List, Dict, Any, Tuple, Callable, Mapping
+import asyncio
+import re
 import omni.ui as ui
 
 from .base_view import BaseView
@@ -39,16 +42,118 @@ class RenderSetupColors:
     TOOLBAR_BG = 0xFF1A1A1A
     PROPERTY_BG = 0xFF2A2A2A
     SPLITTER = 0xFF404040
+    MEMBERS_BG = 0xFF1E1E1E
+    SCENE_ICON = 0xFF90CAF9
+    COLLECTION_ICON = 0xFF90EE90
 
 
 class RenderSetupSizes:
     """Sizes specific to Render Setup UI."""
     TREE_INDENT = 20
     ITEM_HEIGHT = 26
+    ROW_SPACING = 2
     ICON_SIZE = 18
     COLOR_BAR_WIDTH = 4
     TOOLBAR_HEIGHT = 32
     PROPERTY_WIDTH = 320
+    MEMBER_ROW_HEIGHT = 18
+    SWATCH_SIZE = 20
+    SWATCH_GAP = 2
+    MEMBER_PAGE_SIZE = 32
+    ATTR_ROW_HEIGHT = 22
+    ATTR_PAGE_SIZE = 32
+
+
+# Per-row state lookup tables, indexed by a bool (False -> 0, True -> 1).
+_LAYER_BG = (RenderSetupColors.LAYER_BG, RenderSetupColors.LAYER_BG_SELECTED)
+_COLLECTION_BG = (RenderSetupColors.COLLECTION_BG, RenderSetupColors.COLLECTION_BG_SELECTED)
+_OVERRIDE_BG = (RenderSetupColors.OVERRIDE_BG, RenderSetupColors.OVERRIDE_BG_SELECTED)
+_LAYER_ROW_STYLE = tuple({"background_color": c, "border_radius": 2} for c in _LAYER_BG)
+_COLLECTION_ROW_STYLE = tuple({"background_color": c, "border_radius": 2} for c in _COLLECTION_BG)
+_OVERRIDE_ROW_STYLE = tuple({"background_color": c, "border_radius": 2} for c in _OVERRIDE_BG)
+_VIS = (Colors.TEXT_DISABLED, Colors.TEXT_WHITE)
+_REND = (Colors.TEXT_DISABLED, Colors.PRIMARY)
+_EXPAND = (">", "V")
+_ENABLE_ICON = ("D", "E")
+_OVERRIDE_ENABLE_ICON = ("F", "T")
+_OVERRIDE_TEXT = (Colors.TEXT_DISABLED, Colors.TEXT_PRIMARY)
+_VIS_BUTTON_STYLE = tuple({"background_color": 0x00000000, "color": c, "font_size": 12} for c in _VIS)
+_REND_BUTTON_STYLE = tuple({"background_color": 0x00000000, "color": c, "font_size": 12} for c in _REND)
+_ENABLE_BUTTON_STYLE = tuple({"background_color": 0x00000000, "color": c, "font_size": 10} for c in _VIS)
+_OVERRIDE_NAME_STYLE = tuple({"background_color": 0x00000000, "color": c, "font_size": 11} for c in _OVERRIDE_TEXT)
+_OVERRIDE_TYPE_ICON = ("R", "A")
+_OVERRIDE_TYPE_STYLE = tuple({"font_size": 10, "color": c} for c in (Colors.INFO, Colors.WARNING))
+_OVERRIDE_TYPE_LABEL_STYLE = (Styles.LABEL_INFO, Styles.LABEL_WARNING)
+
+# Default values for custom attribute overrides, in priority order: the first
+# pattern found anywhere in the attribute path wins.
+_ATTR_DEFAULTS = (
+    (re.compile(r"translate|scale|rotate"), (0.0, 0.0, 0.0)),
+    (re.compile(r"color"), (1.0, 1.0, 1.0)),
+    (re.compile(r"intensity|exposure"), 1.0),
+)
+
+def _swatch_strip_rgba(colors: Tuple[int, ...], current: int) -> Tuple[List[int], int, int]:
+    """
+    Rasterize a row of layer color swatches into RGBA8 pixels.
+    
+    Colors use omni.ui's 0xAABBGGRR layout. The swatch matching ``current``
+    gets a 2-px white border, like the old per-color buttons.
+    
+    Returns:
+        (pixels, width, height) for ``ui.ByteImageProvider.set_bytes_data``
+    """
+    size = RenderSetupSizes.SWATCH_SIZE
+    gap = RenderSetupSizes.SWATCH_GAP
+    width = len(colors) * (size + gap) - gap
+    row_bytes = width * 4
+    pixels = bytearray(row_bytes * size)
+    white = bytes((0xFF, 0xFF, 0xFF, 0xFF))
+    
+    for index, color in enumerate(colors):
+        rgba = bytes((color & 0xFF, (color >> 8) & 0xFF, (color >> 16) & 0xFF, (color >> 24) & 0xFF))
+        if color == current:
+            edge_row = white * size
+            body_row = white * 2 + rgba * (size - 4) + white * 2
+        else:
+            edge_row = body_row = rgba * size
+        
+        x0 = index * (size + gap) * 4
+        for y in range(size):
+            start = y * row_bytes + x0
+            pixels[start:start + size * 4] = edge_row if y < 2 or y >= size - 2 else body_row
+    
+    return list(pixels), width, size
+
+
+# Tree row flags, computed once per row in RenderSetupView._collect_tree_rows
+_ROW_HAS_CHILDREN = 0x1
+_ROW_EXPANDED = 0x2
+
+# (kind, node, indent, flags)
+_TreeRow = Tuple[str, Any, int, int]
+
+# (visibility, rendering, transform) groups of (attribute, callback) pairs
+_AddOverrideGroups = Tuple[Tuple[Tuple[Mapping[str, Any], Callable[[], None]], ...], ...]
+
+
+class _RowSlot:
+    """
+    A pooled tree row.
+    
+    ``frame`` is the row's background frame inside the tree container,
+    ``kind`` is the row kind its widgets were created for (None when empty),
+    ``widgets`` holds the handles the bind step updates and ``state`` is
+    what the row was last bound to (see ``RenderSetupView._row_state``).
+    """
+    
+    __slots__ = ("frame", "kind", "widgets", "state")
+    
+    def __init__(self, frame: ui.Frame):
+        self.frame = frame
+        self.kind: Optional[str] = None
+        self.widgets: Dict[str, ui.Widget] = {}
+        self.state: Optional[Tuple] = None
 
 
 # =============================================================================
@@ -77,11 +182,52 @@ class RenderSetupView(BaseView):
         self._property_container: Optional[ui.VStack] = None
         self._scene_frame: Optional[ui.Frame] = None
         
+        # Pooled tree row widgets, reused across refreshes
+        self._row_slots: List[_RowSlot] = []
+        self._tree_empty_label: Optional[ui.HStack] = None
+        
+        # Collection member list (rows are created page by page on scroll)
+        self._members_frame: Optional[ui.ScrollingFrame] = None
+        self._members_stack: Optional[ui.VStack] = None
+        self._members: List[Dict[str, str]] = []
+        self._members_built = 0
+        
+        # Attribute picker popup (rows are created page by page on scroll)
+        self._attrs_window: Optional[ui.Window] = None
+        self._attrs_frame: Optional[ui.ScrollingFrame] = None
+        self._attrs_stack: Optional[ui.VStack] = None
+        self._attrs: List[Tuple[str, str, str, Dict[str, Any]]] = []
+        self._attrs_built = 0
+        self._attrs_collection_id: Optional[str] = None
+        
+        # Collapsed state of the collection property sections, by title
+        self._section_collapsed: Dict[str, bool] = {}
+        
+        # What the property panel last displayed (see _property_key)
+        self._last_property_key: Optional[Tuple] = None
+        
+        # Image provider behind the layer color swatches
+        self._swatch_provider: Optional[ui.ByteImageProvider] = None
+        
+        # Inputs of the collection "Add Override" section
+        self._override_type_combo: Optional[ui.ComboBox] = None
+        self._custom_attr_field: Optional[ui.StringField] = None
+        
+        # Value models of the override property panel, patched in place
+        self._override_value_model: Optional[ui.AbstractValueModel] = None
+        self._override_enabled_model: Optional[ui.AbstractValueModel] = None
+        
+        # "Add Override" buttons per collection (see _add_override_buttons)
+        self._collection_add_cbs: Dict[str, _AddOverrideGroups] = {}
+        
         # Drag & drop state
         self._drop_target_collection_id: Optional[str] = None
         
+        # Data changes are coalesced into one rebuild per UI tick
+        self._refresh_pending = False
+        
         # Subscribe to data changes
-        self._vm.add_data_changed_callback(self._refresh_ui)
+        self._vm.add_data_changed_callback(self._schedule_refresh)
     
     def build(self) -> None:
         """Build the UI."""
@@ -114,39 +260,38 @@ class RenderSetupView(BaseView):
                       style={"background_color": RenderSetupColors.TOOLBAR_BG}):
             ui.Spacer(width=8)
             
-            # Create Layer button
-            ui.Button(
-                "+",
-                width=28,
-                height=24,
-                tooltip="Create Render Layer",
-                clicked_fn=self._on_create_layer_clicked,
-                style={
-                    "background_color": 0xFF3A8EBA,
-                    "border_radius": 3,
-                    "font_size": 16
-                }
-            )
-            
-            ui.Spacer(width=8)
-            
-            # Title
-            ui.Label(
-                "Render Setup",
-                style={"font_size": 14, "color": Colors.TEXT_PRIMARY}
-            )
-            
-            ui.Spacer()
-            
-            # Refresh button
-            ui.Button(
-                "R",
-                width=24,
-                height=24,
-                tooltip="Refresh",
-                clicked_fn=self._on_refresh_clicked,
-                style={"border_radius": 3}
-            )
+            with ui.HStack(spacing=8):
+                # Create Layer button
+                ui.Button(
+                    "+",
+                    width=28,
+                    height=24,
+                    tooltip="Create Render Layer",
+                    clicked_fn=self._on_create_layer_clicked,
+                    style={
+                        "background_color": Colors.PRIMARY,
+                        "border_radius": 3,
+                        "font_size": 16
+                    }
+                )
+                
+                # Title
+                ui.Label(
+                    "Render Setup",
+                    style={"font_size": 14, "color": Colors.TEXT_PRIMARY}
+                )
+                
+                ui.Spacer()
+                
+                # Refresh button
+                ui.Button(
+                    "R",
+                    width=24,
+                    height=24,
+                    tooltip="Refresh",
+                    clicked_fn=self._on_refresh_clicked,
+                    style={"border_radius": 3}
+                )
             
             ui.Spacer(width=8)
     
@@ -167,7 +312,7 @@ class RenderSetupView(BaseView):
                     ui.Label(
                         "S",
                         width=RenderSetupSizes.ICON_SIZE,
-                        style={"font_size": 12, "color": 0xFF90CAF9}
+                        style={"font_size": 12, "color": RenderSetupColors.SCENE_ICON}
                     )
                     
                     ui.Spacer(width=4)
@@ -194,243 +339,307 @@ class RenderSetupView(BaseView):
         ):
             self._tree_container = ui.VStack(spacing=1)
             with self._tree_container:
-                self._build_tree_content()
+                self._tree_empty_label = ui.HStack(height=40)
+                with self._tree_empty_label:
+                    ui.Spacer(width=20)
+                    ui.Label(
+                        "No render layers. Click '+' to create one.",
+                        style=Styles.LABEL_SECONDARY
+                    )
+        self._build_tree_content()
     
     def _build_tree_content(self) -> None:
-        """Build the actual tree content."""
-        layers = self._vm.layers
+        """
+        Bring the tree rows in line with the current data.
         
-        if not layers:
-            with ui.HStack(height=40):
-                ui.Spacer(width=20)
-                ui.Label(
-                    "No render layers. Click '+' to create one.",
-                    style={"color": Colors.TEXT_SECONDARY}
-                )
-        else:
-            for layer in layers:
-                self._build_layer_item(layer)
+        Rows live in pooled slots (see ``_RowSlot``). A slot whose widgets
+        already have the right kind is rebound in place; only a kind change
+        rebuilds the slot's widgets. A slot already showing the same state
+        is left alone. Slots past the last row are hidden and kept for reuse.
+        """
+        if not self._tree_container:
+            return
+        
+        rows = self._collect_tree_rows()
+        self._tree_empty_label.visible = not rows
+        
+        # Grow the pool if the tree got longer than ever before
+        if len(rows) > len(self._row_slots):
+            with self._tree_container:
+                for _ in range(len(rows) - len(self._row_slots)):
+                    self._row_slots.append(_RowSlot(ui.Frame(height=RenderSetupSizes.ITEM_HEIGHT)))
+        
+        selected = self._vm.selected_item
+        for slot, (kind, node, indent, flags) in zip(self._row_slots, rows):
+            create, bind = self._ROW_BUILDERS[kind]
+            if slot.kind != kind:
+                slot.frame.clear()
+                slot.widgets = {}
+                with slot.frame:
+                    create(self, slot.widgets)
+                slot.kind = kind
+                slot.state = None
+            is_selected = selected == (node.id, kind)
+            state = self._row_state(kind, node, indent, flags, is_selected)
+            if state != slot.state:
+                bind(self, slot, node, indent, flags, is_selected)
+                slot.state = state
+            slot.frame.visible = True
+        
+        for slot in self._row_slots[len(rows):]:
+            slot.frame.visible = False
     
-    def _build_layer_item(self, layer: RenderLayer) -> None:
-        """Build a layer item in the tree."""
-        selected_id, selected_type = self._vm.selected_item
-        is_selected = selected_type == "layer" and selected_id == layer.id
+    def _collect_tree_rows(self) -> List[_TreeRow]:
+        """
+        Flatten the visible tree into (kind, node, indent, flags) rows.
         
-        bg_color = RenderSetupColors.LAYER_BG_SELECTED if is_selected else RenderSetupColors.LAYER_BG
+        Walks layers > collections > overrides depth-first with an explicit
+        stack, only descending into expanded nodes. ``kind`` matches the
+        selection type strings used by the ViewModel; ``flags`` carries the
+        ``_ROW_*`` bits so row builders don't re-derive them.
+        """
+        rows: List[_TreeRow] = []
+        stack: List[Tuple[str, Any, int]] = [("layer", layer, 0) for layer in reversed(self._vm.layers)]
         
-        with ui.VStack(spacing=0):
-            # Layer row
-            with ui.ZStack(height=RenderSetupSizes.ITEM_HEIGHT):
-                # Background
-                ui.Rectangle(style={"background_color": bg_color, "border_radius": 2})
-                
-                with ui.HStack():
-                    # Color bar
-                    ui.Rectangle(
-                        width=RenderSetupSizes.COLOR_BAR_WIDTH,
-                        style={"background_color": layer.color, "border_radius": 2}
-                    )
-                    
-                    ui.Spacer(width=4)
-                    
-                    # Expand/collapse button
-                    expand_icon = "V" if layer.expanded else ">"
-                    ui.Button(
-                        expand_icon,
-                        width=16,
-                        height=16,
-                        clicked_fn=lambda lid=layer.id: self._on_layer_expand_clicked(lid),
-                        style={"background_color": 0x00000000, "font_size": 10}
-                    )
-                    
-                    ui.Spacer(width=2)
-                    
-                    # Layer icon
-                    ui.Label(
-                        "L",
-                        width=RenderSetupSizes.ICON_SIZE,
-                        style={"font_size": 11, "color": layer.color}
-                    )
-                    
-                    # Layer name (clickable)
-                    name_btn = ui.Button(
-                        layer.name,
-                        clicked_fn=lambda lid=layer.id: self._on_layer_selected(lid),
-                        style={
-                            "background_color": 0x00000000,
-                            "color": Colors.TEXT_PRIMARY,
-                            "font_size": 12
-                        }
-                    )
-                    
-                    ui.Spacer()
-                    
-                    # Visibility toggle (eye icon)
-                    vis_color = 0xFFFFFFFF if layer.visible else 0xFF606060
-                    ui.Button(
-                        "O",  # Eye icon placeholder
-                        width=22,
-                        height=22,
-                        tooltip="Toggle Visibility (Set as Active Layer)",
-                        clicked_fn=lambda lid=layer.id, vis=layer.visible: self._on_layer_visibility_clicked(lid, vis),
-                        style={"background_color": 0x00000000, "color": vis_color, "font_size": 12}
-                    )
-                    
-                    # Renderable toggle (clapperboard icon)
-                    rend_color = 0xFF3A8EBA if layer.renderable else 0xFF606060
-                    ui.Button(
-                        "R",  # Clapperboard icon placeholder
-                        width=22,
-                        height=22,
-                        tooltip="Toggle Renderable",
-                        clicked_fn=lambda lid=layer.id, rend=layer.renderable: self._on_layer_renderable_clicked(lid, rend),
-                        style={"background_color": 0x00000000, "color": rend_color, "font_size": 12}
-                    )
-                    
-                    ui.Spacer(width=4)
+        while stack:
+            kind, node, indent = stack.pop()
+            
+            flags = 0
+            if kind == "layer":
+                if node.collections:
+                    flags |= _ROW_HAS_CHILDREN
+            elif kind == "collection":
+                if node.overrides or node.sub_collections:
+                    flags |= _ROW_HAS_CHILDREN
+            if kind != "override" and node.expanded:
+                flags |= _ROW_EXPANDED
+            rows.append((kind, node, indent, flags))
+            
+            if not flags & _ROW_EXPANDED:
+                continue
             
-            # Collections (if expanded)
-            if layer.expanded:
-                for collection in layer.collections:
-                    self._build_collection_item(collection, layer.id, indent=1)
+            child_indent = indent + 1
+            if kind == "layer":
+                stack.extend(("collection", col, child_indent) for col in reversed(node.collections))
+            else:
+                # Overrides are listed before sub-collections
+                stack.extend(("collection", sub, child_indent) for sub in reversed(node.sub_collections))
+                stack.extend(("override", ovr, child_indent) for ovr in reversed(node.overrides))
+        
+        return rows
+    
+    @staticmethod
+    def _row_state(kind: str, node: Any, indent: int, flags: int, is_selected: bool) -> Tuple:
+        """Return everything a tree row displays or captures in its callbacks."""
+        if kind == "layer":
+            fields = (node.name, node.color, node.visible, node.renderable)
+        elif kind == "collection":
+            fields = (node.name, node.enabled)
+        else:
+            fields = (node.name, repr(node.value), node.override_type, node.enabled)
+        return (node.id, indent, flags, is_selected) + fields
+    
+    # -------------------------------------------------------------------------
+    # Tree rows: each kind has a create step (widgets only) and a bind step
+    # (data, styles and callbacks), so pooled rows can be rebound in place.
+    # -------------------------------------------------------------------------
+    
+    def _create_layer_row(self, widgets: Dict[str, ui.Widget]) -> None:
+        """Create the widgets of a layer row."""
+        with ui.HStack():
+            # Color bar
+            widgets["color_bar"] = ui.Rectangle(width=RenderSetupSizes.COLOR_BAR_WIDTH)
+            ui.Spacer(width=4)
+            
+            # Expand/collapse button
+            widgets["expand"] = ui.Button(
+                "",
+                width=16,
+                height=16,
+                style={"background_color": 0x00000000, "font_size": 10}
+            )
+            ui.Spacer(width=RenderSetupSizes.ROW_SPACING)
+            
+            # Layer icon
+            widgets["icon"] = ui.Label("L", width=RenderSetupSizes.ICON_SIZE)
+            
+            # Layer name (clickable)
+            widgets["name"] = ui.Button(
+                "",
+                style={
+                    "background_color": 0x00000000,
+                    "color": Colors.TEXT_PRIMARY,
+                    "font_size": 12
+                }
+            )
+            
+            ui.Spacer()
+            
+            # Visibility toggle (eye icon)
+            widgets["visible"] = ui.Button(
+                "O",  # Eye icon placeholder
+                width=22,
+                height=22,
+                tooltip="Toggle Visibility (Set as Active Layer)"
+            )
+            
+            # Renderable toggle (clapperboard icon)
+            widgets["renderable"] = ui.Button(
+                "R",  # Clapperboard icon placeholder
+                width=22,
+                height=22,
+                tooltip="Toggle Renderable"
+            )
+            
+            ui.Spacer(width=4)
+    
+    def _bind_layer_row(self, slot: "_RowSlot", layer: RenderLayer, indent: int,
+                        flags: int, is_selected: bool) -> None:
+        """Bind a layer to a layer row."""
+        w = slot.widgets
+        slot.frame.style = _LAYER_ROW_STYLE[is_selected]
+        w["color_bar"].style = {"background_color": layer.color, "border_radius": 2}
+        w["expand"].text = _EXPAND[layer.expanded]
+        w["expand"].set_clicked_fn(lambda lid=layer.id: self._on_layer_expand_clicked(lid))
+        w["icon"].style = {"font_size": 11, "color": layer.color}
+        w["name"].text = layer.name
+        w["name"].set_clicked_fn(lambda lid=layer.id: self._on_layer_selected(lid))
+        w["visible"].style = _VIS_BUTTON_STYLE[layer.visible]
+        w["visible"].set_clicked_fn(
+            lambda lid=layer.id, vis=layer.visible: self._on_layer_visibility_clicked(lid, vis)
+        )
+        w["renderable"].style = _REND_BUTTON_STYLE[layer.renderable]
+        w["renderable"].set_clicked_fn(
+            lambda lid=layer.id, rend=layer.renderable: self._on_layer_renderable_clicked(lid, rend)
+        )
     
-    def _build_collection_item(self, collection: Collection, layer_id: str, indent: int = 1) -> None:
-        """Build a collection item in the tree."""
-        selected_id, selected_type = self._vm.selected_item
-        is_selected = selected_type == "collection" and selected_id == collection.id
+    def _create_collection_row(self, widgets: Dict[str, ui.Widget]) -> None:
+        """Create the widgets of a collection row."""
+        with ui.HStack():
+            # Indent
+            widgets["indent"] = ui.Spacer(width=0)
+            
+            # Expand/collapse button (blank and disabled when there are no children)
+            widgets["expand"] = ui.Button(
+                "",
+                width=16,
+                height=16,
+                style={"background_color": 0x00000000, "font_size": 10}
+            )
+            ui.Spacer(width=RenderSetupSizes.ROW_SPACING)
+            
+            # Collection icon (diamond)
+            ui.Label(
+                "*",
+                width=RenderSetupSizes.ICON_SIZE,
+                style={"font_size": 14, "color": RenderSetupColors.COLLECTION_ICON}
+            )
+            
+            # Collection name (clickable)
+            widgets["name"] = ui.Button(
+                "",
+                style={
+                    "background_color": 0x00000000,
+                    "color": Colors.TEXT_PRIMARY,
+                    "font_size": 12
+                }
+            )
+            
+            ui.Spacer()
+            
+            # Select collection members button (diamond icon)
+            widgets["select"] = ui.Button(
+                "*",
+                width=22,
+                height=22,
+                tooltip="Select Collection Members",
+                style={"background_color": 0x00000000, "color": RenderSetupColors.COLLECTION_ICON, "font_size": 12}
+            )
+            
+            # Enable/disable toggle
+            widgets["enable"] = ui.Button(
+                "",
+                width=22,
+                height=22,
+                tooltip="Enable/Disable Collection"
+            )
+            
+            ui.Spacer(width=4)
+    
+    def _bind_collection_row(self, slot: "_RowSlot", collection: Collection, indent: int,
+                             flags: int, is_selected: bool) -> None:
+        """Bind a collection to a collection row."""
+        w = slot.widgets
+        slot.frame.style = _COLLECTION_ROW_STYLE[is_selected]
+        w["indent"].width = ui.Pixel(indent * RenderSetupSizes.TREE_INDENT)
         
-        bg_color = RenderSetupColors.COLLECTION_BG_SELECTED if is_selected else RenderSetupColors.COLLECTION_BG
-        indent_width = indent * RenderSetupSizes.TREE_INDENT
+        has_children = bool(flags & _ROW_HAS_CHILDREN)
+        w["expand"].text = _EXPAND[collection.expanded] if has_children else ""
+        w["expand"].enabled = has_children
+        w["expand"].set_clicked_fn(lambda cid=collection.id: self._on_collection_expand_clicked(cid))
         
-        with ui.VStack(spacing=0):
-            # Collection row
-            with ui.ZStack(height=RenderSetupSizes.ITEM_HEIGHT):
-                # Background
-                ui.Rectangle(style={"background_color": bg_color, "border_radius": 2})
-                
-                with ui.HStack():
-                    # Indent
-                    ui.Spacer(width=indent_width)
-                    
-                    # Expand/collapse button
-                    has_children = len(collection.overrides) > 0 or len(collection.sub_collections) > 0
-                    if has_children:
-                        expand_icon = "V" if collection.expanded else ">"
-                        ui.Button(
-                            expand_icon,
-                            width=16,
-                            height=16,
-                            clicked_fn=lambda cid=collection.id: self._on_collection_expand_clicked(cid),
-                            style={"background_color": 0x00000000, "font_size": 10}
-                        )
-                    else:
-                        ui.Spacer(width=16)
-                    
-                    ui.Spacer(width=2)
-                    
-                    # Collection icon (diamond)
-                    ui.Label(
-                        "*",
-                        width=RenderSetupSizes.ICON_SIZE,
-                        style={"font_size": 14, "color": 0xFF90EE90}
-                    )
-                    
-                    # Collection name (clickable)
-                    ui.Button(
-                        collection.name,
-                        clicked_fn=lambda cid=collection.id: self._on_collection_selected(cid),
-                        style={
-                            "background_color": 0x00000000,
-                            "color": Colors.TEXT_PRIMARY,
-                            "font_size": 12
-                        }
-                    )
-                    
-                    ui.Spacer()
-                    
-                    # Select collection members button (diamond icon)
-                    ui.Button(
-                        "*",
-                        width=22,
-                        height=22,
-                        tooltip="Select Collection Members",
-                        clicked_fn=lambda cid=collection.id: self._on_select_collection_members(cid),
-                        style={"background_color": 0x00000000, "color": 0xFF90EE90, "font_size": 12}
-                    )
-                    
-                    # Enable/disable toggle
-                    enable_color = 0xFFFFFFFF if collection.enabled else 0xFF606060
-                    enable_icon = "E" if collection.enabled else "D"
-                    ui.Button(
-                        enable_icon,
-                        width=22,
-                        height=22,
-                        tooltip="Enable/Disable Collection",
-                        clicked_fn=lambda cid=collection.id, en=collection.enabled: self._on_collection_enable_clicked(cid, en),
-                        style={"background_color": 0x00000000, "color": enable_color, "font_size": 10}
-                    )
-                    
-                    ui.Spacer(width=4)
+        w["name"].text = collection.name
+        w["name"].set_clicked_fn(lambda cid=collection.id: self._on_collection_selected(cid))
+        w["select"].set_clicked_fn(lambda cid=collection.id: self._on_select_collection_members(cid))
+        w["enable"].text = _ENABLE_ICON[collection.enabled]
+        w["enable"].style = _ENABLE_BUTTON_STYLE[collection.enabled]
+        w["enable"].set_clicked_fn(
+            lambda cid=collection.id, en=collection.enabled: self._on_collection_enable_clicked(cid, en)
+        )
+    
+    def _create_override_row(self, widgets: Dict[str, ui.Widget]) -> None:
+        """Create the widgets of an override row."""
+        with ui.HStack():
+            # Indent (plus the expand button slot overrides don't have)
+            widgets["indent"] = ui.Spacer(width=0)
             
-            # Overrides and sub-collections (if expanded)
-            if collection.expanded:
-                for override in collection.overrides:
-                    self._build_override_item(override, collection.id, indent + 1)
-                for sub_col in collection.sub_collections:
-                    self._build_collection_item(sub_col, layer_id, indent + 1)
-    
-    def _build_override_item(self, override: Override, collection_id: str, indent: int = 2) -> None:
-        """Build an override item in the tree."""
-        selected_id, selected_type = self._vm.selected_item
-        is_selected = selected_type == "override" and selected_id == override.id
+            # Override type icon
+            widgets["type"] = ui.Label("", width=RenderSetupSizes.ICON_SIZE)
+            
+            # Override name
+            widgets["name"] = ui.Button("")
+            
+            ui.Spacer()
+            
+            # Enable/disable toggle
+            widgets["enable"] = ui.Button(
+                "",
+                width=22,
+                height=22,
+                tooltip="Enable/Disable Override"
+            )
+            
+            ui.Spacer(width=4)
+    
+    def _bind_override_row(self, slot: "_RowSlot", override: Override, indent: int,
+                           flags: int, is_selected: bool) -> None:
+        """Bind an override to an override row."""
+        w = slot.widgets
+        slot.frame.style = _OVERRIDE_ROW_STYLE[is_selected]
+        w["indent"].width = ui.Pixel(
+            indent * RenderSetupSizes.TREE_INDENT + 16 + RenderSetupSizes.ROW_SPACING
+        )
         
-        bg_color = RenderSetupColors.OVERRIDE_BG_SELECTED if is_selected else RenderSetupColors.OVERRIDE_BG
-        indent_width = indent * RenderSetupSizes.TREE_INDENT
+        is_absolute = override.override_type == OverrideType.ABSOLUTE
+        w["type"].text = _OVERRIDE_TYPE_ICON[is_absolute]
+        w["type"].style = _OVERRIDE_TYPE_STYLE[is_absolute]
         
-        with ui.ZStack(height=RenderSetupSizes.ITEM_HEIGHT):
-            # Background
-            ui.Rectangle(style={"background_color": bg_color, "border_radius": 2})
-            
-            with ui.HStack():
-                # Indent
-                ui.Spacer(width=indent_width)
-                
-                ui.Spacer(width=18)  # No expand button for overrides
-                
-                # Override type icon
-                type_icon = "A" if override.override_type == OverrideType.ABSOLUTE else "R"
-                type_color = 0xFFFFAA00 if override.override_type == OverrideType.ABSOLUTE else 0xFF00AAFF
-                ui.Label(
-                    type_icon,
-                    width=RenderSetupSizes.ICON_SIZE,
-                    style={"font_size": 10, "color": type_color}
-                )
-                
-                # Override name
-                ui.Button(
-                    f"{override.name}: {override.value}",
-                    clicked_fn=lambda oid=override.id: self._on_override_selected(oid),
-                    style={
-                        "background_color": 0x00000000,
-                        "color": Colors.TEXT_PRIMARY if override.enabled else Colors.TEXT_DISABLED,
-                        "font_size": 11
-                    }
-                )
-                
-                ui.Spacer()
-                
-                # Enable/disable toggle
-                enable_color = 0xFFFFFFFF if override.enabled else 0xFF606060
-                ui.Button(
-                    "T" if override.enabled else "F",
-                    width=22,
-                    height=22,
-                    tooltip="Enable/Disable Override",
-                    clicked_fn=lambda oid=override.id, en=override.enabled: self._on_override_enable_clicked(oid, en),
-                    style={"background_color": 0x00000000, "color": enable_color, "font_size": 10}
-                )
-                
-                ui.Spacer(width=4)
+        w["name"].text = f"{override.name}: {override.value}"
+        w["name"].style = _OVERRIDE_NAME_STYLE[override.enabled]
+        w["name"].set_clicked_fn(lambda oid=override.id: self._on_override_selected(oid))
+        
+        w["enable"].text = _OVERRIDE_ENABLE_ICON[override.enabled]
+        w["enable"].style = _ENABLE_BUTTON_STYLE[override.enabled]
+        w["enable"].set_clicked_fn(
+            lambda oid=override.id, en=override.enabled: self._on_override_enable_clicked(oid, en)
+        )
+    
+    # (create, bind) pairs keyed by tree row kind (see _collect_tree_rows)
+    _ROW_BUILDERS = {
+        "layer": (_create_layer_row, _bind_layer_row),
+        "collection": (_create_collection_row, _bind_collection_row),
+        "override": (_create_override_row, _bind_override_row),
+    }
     
     # =========================================================================
     # Property Editor Section
@@ -455,6 +664,7 @@ class RenderSetupView(BaseView):
                 vertical_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED
             ):
                 self._property_container = ui.VStack(spacing=Sizes.SPACING_SMALL)
+                self._last_property_key = self._property_key()
                 with self._property_container:
                     self._build_property_content()
     
@@ -466,7 +676,7 @@ class RenderSetupView(BaseView):
             ui.Spacer(height=20)
             ui.Label(
                 "Select a layer or collection to edit properties",
-                style={"color": Colors.TEXT_SECONDARY},
+                style=Styles.LABEL_SECONDARY,
                 alignment=ui.Alignment.CENTER
             )
             return
@@ -505,20 +715,7 @@ class RenderSetupView(BaseView):
                     with ui.HStack(height=24):
                         ui.Label("Color:", width=100)
                         colors = self._vm.get_layer_colors()
-                        for color in colors:
-                            is_current = color == layer.color
-                            style = {
-                                "background_color": color,
-                                "border_width": 2 if is_current else 0,
-                                "border_color": 0xFFFFFFFF
-                            }
-                            ui.Button(
-                                "",
-                                width=20,
-                                height=20,
-                                clicked_fn=lambda c=color, lid=layer.id: self._on_layer_color_changed(lid, c),
-                                style=style
-                            )
+                        self._build_color_swatches(layer.id, colors, layer.color)
                         ui.Spacer()
                     
                     # Isolate Mode toggle
@@ -531,7 +728,7 @@ class RenderSetupView(BaseView):
                         )
                         ui.Label(
                             "Only show collection members",
-                            style={"color": Colors.TEXT_SECONDARY, "font_size": 11}
+                            style=Styles.LABEL_SECONDARY_11
                         )
                     
                     ui.Spacer(height=4)
@@ -542,7 +739,7 @@ class RenderSetupView(BaseView):
                 "Create Collection",
                 height=Sizes.BUTTON_HEIGHT,
                 clicked_fn=lambda lid=layer.id: self._on_create_collection_clicked(lid),
-                style={"background_color": 0xFF3A8EBA}
+                style={"background_color": Colors.PRIMARY}
             )
             
             # Delete Layer button
@@ -551,9 +748,38 @@ class RenderSetupView(BaseView):
                 "Delete Layer",
                 height=Sizes.BUTTON_HEIGHT,
                 clicked_fn=lambda lid=layer.id: self._on_delete_layer_clicked(lid),
-                style={"background_color": 0xFF8E3A3A}
+                style=Styles.BUTTON_DANGER_BG
             )
     
+    def _build_color_swatches(self, layer_id: str, colors: List[int], current: int) -> None:
+        """
+        Build the layer color picker as a single image.
+        
+        All swatches are drawn into one ``ByteImageProvider`` and a click is
+        mapped back to a color by its x offset, instead of one button per color.
+        """
+        pixels, width, height = _swatch_strip_rgba(tuple(colors), current)
+        self._swatch_provider = ui.ByteImageProvider()
+        self._swatch_provider.set_bytes_data(pixels, [width, height])
+        
+        image = ui.ImageWithProvider(self._swatch_provider, width=width, height=height)
+        image.set_mouse_pressed_fn(
+            lambda x, y, button, modifier, lid=layer_id, cols=colors, img=image, w=width:
+            self._on_swatch_pressed(lid, cols, img, w, x, button)
+        )
+    
+    def _on_swatch_pressed(self, layer_id: str, colors: List[int], image: ui.Widget,
+                           image_width: int, x: float, button: int) -> None:
+        """Map a click on the swatch strip to a layer color."""
+        if button != 0 or image.computed_width <= 0:
+            return
+        local_x = (x - image.screen_position_x) * image_width / image.computed_width
+        stride = RenderSetupSizes.SWATCH_SIZE + RenderSetupSizes.SWATCH_GAP
+        index = int(local_x // stride)
+        # Ignore clicks that land in the gap between swatches
+        if 0 <= index < len(colors) and local_x - index * stride < RenderSetupSizes.SWATCH_SIZE:
+            self._on_layer_color_changed(layer_id, colors[index])
+    
     def _build_collection_properties(self) -> None:
         """Build property editor for a collection."""
         collection = self._vm.selected_collection
@@ -580,192 +806,19 @@ class RenderSetupView(BaseView):
                     ui.Spacer(height=4)
             
             # Collection Filters
-            with ui.CollapsableFrame("Collection Filters", collapsed=False):
-                with ui.VStack(spacing=Sizes.SPACING_SMALL):
-                    ui.Spacer(height=4)
-                    
-                    # Filter type dropdown
-                    with ui.HStack(height=24):
-                        ui.Label("Filter:", width=100)
-                        filter_combo = ui.ComboBox(0)
-                        filter_types = self._vm.get_filter_types()
-                        for i, ft in enumerate(filter_types):
-                            filter_combo.model.append_child_item(None, ui.SimpleStringModel(ft))
-                            if ft == collection.filter_type.value:
-                                filter_combo.model.get_item_value_model().set_value(i)
-                        filter_combo.model.add_item_changed_fn(
-                            lambda m, item, cid=collection.id, types=filter_types: 
-                            self._on_collection_filter_changed(cid, types[m.get_item_value_model().get_value_as_int()])
-                        )
-                    
-                    ui.Spacer(height=4)
+            self._build_collection_section(
+                "Collection Filters", partial(self._build_collection_filters_section, collection)
+            )
             
             # Add to Collection
-            with ui.CollapsableFrame("Add to Collection", collapsed=False):
-                with ui.VStack(spacing=Sizes.SPACING_SMALL):
-                    ui.Spacer(height=4)
-                    
-                    # Expression
-                    ui.Label("Include:", style={"color": Colors.TEXT_SECONDARY})
-                    with ui.HStack(height=24):
-                        ui.Label("Expression:", width=80)
-                        expr_field = ui.StringField()
-                        expr_field.model.set_value(collection.expression)
-                        expr_field.model.add_end_edit_fn(
-                            lambda m, cid=collection.id: self._on_collection_expression_changed(cid, m.get_value_as_string())
-                        )
-                    
-                    ui.Label(
-                        "Use wildcards: *Character* ; *_geo",
-                        style={"color": Colors.TEXT_SECONDARY, "font_size": 10}
-                    )
-                    
-                    ui.Spacer(height=4)
-                    
-                    # Manual add/remove buttons
-                    with ui.HStack(height=Sizes.BUTTON_HEIGHT):
-                        ui.Button(
-                            "Add",
-                            clicked_fn=lambda cid=collection.id: self._on_add_to_collection_clicked(cid),
-                            tooltip="Add selected objects to collection"
-                        )
-                        ui.Button(
-                            "Remove",
-                            clicked_fn=lambda cid=collection.id: self._on_remove_from_collection_clicked(cid),
-                            tooltip="Remove selected objects from collection"
-                        )
-                        ui.Button(
-                            "Select",
-                            clicked_fn=lambda cid=collection.id: self._on_select_collection_members(cid),
-                            tooltip="Select all collection members"
-                        )
-                    
-                    ui.Spacer(height=4)
-                    
-                    # Member list
-                    ui.Label("Members:", style={"color": Colors.TEXT_SECONDARY})
-                    members = self._vm.get_collection_members(collection.id)
-                    
-                    with ui.ScrollingFrame(
-                        height=100,
-                        horizontal_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED,
-                        vertical_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED,
-                        style={"background_color": 0xFF1E1E1E, "border_radius": 4}
-                    ):
-                        with ui.VStack(spacing=1):
-                            if not members:
-                                ui.Label(
-                                    "  No members",
-                                    style={"color": Colors.TEXT_SECONDARY}
-                                )
-                            else:
-                                for member in members[:50]:  # Limit display
-                                    with ui.HStack(height=18):
-                                        ui.Label(
-                                            f"  {member['name']}",
-                                            elided_text=True,
-                                            tooltip=member['path'],
-                                            style={"color": Colors.TEXT_PRIMARY, "font_size": 11}
-                                        )
-                                if len(members) > 50:
-                                    ui.Label(
-                                        f"  ... and {len(members) - 50} more",
-                                        style={"color": Colors.TEXT_SECONDARY}
-                                    )
-                    
-                    with ui.HStack(height=20):
-                        ui.Label(f"View All ({len(members)})", style={"color": Colors.TEXT_SECONDARY})
-                        ui.Spacer()
-                        ui.Button(
-                            "Select All",
-                            width=70,
-                            height=20,
-                            clicked_fn=lambda cid=collection.id: self._on_select_collection_members(cid)
-                        )
-                    
-                    ui.Spacer(height=4)
+            self._build_collection_section(
+                "Add to Collection", partial(self._build_add_to_collection_section, collection)
+            )
             
             # Add Override
-            with ui.CollapsableFrame("Add Override", collapsed=False):
-                with ui.VStack(spacing=Sizes.SPACING_SMALL):
-                    ui.Spacer(height=4)
-                    
-                    # Override type
-                    with ui.HStack(height=24):
-                        ui.Label("Type:", width=80)
-                        self._override_type_combo = ui.ComboBox(0)
-                        override_types = self._vm.get_override_types()
-                        for ot in override_types:
-                            self._override_type_combo.model.append_child_item(None, ui.SimpleStringModel(ot))
-                    
-                    ui.Spacer(height=4)
-                    
-                    # Common attributes - Visibility
-                    ui.Label("Visibility:", style={"color": Colors.TEXT_SECONDARY, "font_size": 11})
-                    with ui.HStack(height=22, spacing=4):
-                        for attr in self._vm.get_visibility_attributes():
-                            ui.Button(
-                                f"+ {attr['name']}",
-                                height=20,
-                                clicked_fn=lambda cid=collection.id, a=attr: self._on_add_common_override(cid, a),
-                                tooltip=attr['description'],
-                                style={"font_size": 10}
-                            )
-                    
-                    # Common attributes - Rendering
-                    ui.Label("Rendering:", style={"color": Colors.TEXT_SECONDARY, "font_size": 11})
-                    with ui.VStack(spacing=2):
-                        for attr in self._vm.get_rendering_attributes():
-                            ui.Button(
-                                f"+ {attr['name']}",
-                                height=20,
-                                clicked_fn=lambda cid=collection.id, a=attr: self._on_add_common_override(cid, a),
-                                tooltip=attr['description'],
-                                style={"font_size": 10}
-                            )
-                    
-                    # Common attributes - Transform
-                    ui.Label("Transform:", style={"color": Colors.TEXT_SECONDARY, "font_size": 11})
-                    with ui.HStack(height=22, spacing=4):
-                        for attr in self._vm.get_transform_attributes():
-                            ui.Button(
-                                f"+ {attr['name']}",
-                                height=20,
-                                clicked_fn=lambda cid=collection.id, a=attr: self._on_add_common_override(cid, a),
-                                tooltip=attr['description'],
-                                style={"font_size": 10}
-                            )
-                    
-                    ui.Spacer(height=8)
-                    
-                    # Custom attribute input
-                    ui.Label("Custom Attribute:", style={"color": Colors.TEXT_SECONDARY, "font_size": 11})
-                    with ui.HStack(height=24, spacing=4):
-                        self._custom_attr_field = ui.StringField()
-                        self._custom_attr_field.model.set_value("")
-                        ui.Button(
-                            "Add",
-                            width=50,
-                            height=22,
-                            clicked_fn=lambda cid=collection.id: self._on_add_custom_override(cid),
-                            tooltip="Add custom attribute override"
-                        )
-                    ui.Label(
-                        "Enter attribute path (e.g., visibility, xformOp:translate)",
-                        style={"color": Colors.TEXT_SECONDARY, "font_size": 9}
-                    )
-                    
-                    ui.Spacer(height=4)
-                    
-                    # Get attributes from selection
-                    ui.Button(
-                        "Get Attributes from Selection...",
-                        height=Sizes.BUTTON_HEIGHT,
-                        clicked_fn=lambda cid=collection.id: self._on_show_prim_attributes(cid),
-                        tooltip="Show attributes of selected prim"
-                    )
-                    
-                    ui.Spacer(height=4)
+            self._build_collection_section(
+                "Add Override", partial(self._build_add_override_section, collection)
+            )
             
             # Actions
             ui.Spacer(height=8)
@@ -786,9 +839,203 @@ class RenderSetupView(BaseView):
                     "Delete Collection",
                     height=Sizes.BUTTON_HEIGHT,
                     clicked_fn=lambda lid=layer_id, cid=collection.id: self._on_delete_collection_clicked(lid, cid),
-                    style={"background_color": 0xFF8E3A3A}
+                    style=Styles.BUTTON_DANGER_BG
                 )
     
+    def _build_collection_section(self, title: str, build_fn: Callable[[], None]) -> None:
+        """
+        Build a collapsable collection property section.
+        
+        The section keeps the collapsed state the user last gave it, since
+        edits inside it rebuild the whole property panel. Its content is
+        built by ``build_fn`` only while the frame is expanded.
+        """
+        frame = ui.CollapsableFrame(
+            title,
+            collapsed=self._section_collapsed.get(title, False),
+            build_fn=build_fn
+        )
+        frame.set_collapsed_changed_fn(partial(self._section_collapsed.__setitem__, title))
+    
+    def _build_collection_filters_section(self, collection: Collection) -> None:
+        """Build the "Collection Filters" section (built on first draw)."""
+        with ui.VStack(spacing=Sizes.SPACING_SMALL):
+            ui.Spacer(height=4)
+            
+            # Filter type dropdown
+            with ui.HStack(height=24):
+                ui.Label("Filter:", width=100)
+                filter_types = self._vm.get_filter_types()
+                current = collection.filter_type.value
+                filter_index = filter_types.index(current) if current in filter_types else 0
+                filter_combo = ui.ComboBox(filter_index, *filter_types)
+                filter_combo.model.add_item_changed_fn(
+                    lambda m, item, cid=collection.id, types=filter_types: 
+                    self._on_collection_filter_changed(cid, types[m.get_item_value_model().get_value_as_int()])
+                )
+            
+            ui.Spacer(height=4)
+    
+    def _build_add_to_collection_section(self, collection: Collection) -> None:
+        """Build the "Add to Collection" section (built on first draw)."""
+        with ui.VStack(spacing=Sizes.SPACING_SMALL):
+            ui.Spacer(height=4)
+            
+            # Expression
+            ui.Label("Include:", style=Styles.LABEL_SECONDARY)
+            with ui.HStack(height=24):
+                ui.Label("Expression:", width=80)
+                expr_field = ui.StringField()
+                expr_field.model.set_value(collection.expression)
+                expr_field.model.add_end_edit_fn(
+                    lambda m, cid=collection.id: self._on_collection_expression_changed(cid, m.get_value_as_string())
+                )
+            
+            ui.Label(
+                "Use wildcards: *Character* ; *_geo",
+                style=Styles.LABEL_SECONDARY_10
+            )
+            
+            ui.Spacer(height=4)
+            
+            # Manual add/remove buttons
+            with ui.HStack(height=Sizes.BUTTON_HEIGHT):
+                ui.Button(
+                    "Add",
+                    clicked_fn=lambda cid=collection.id: self._on_add_to_collection_clicked(cid),
+                    tooltip="Add selected objects to collection"
+                )
+                ui.Button(
+                    "Remove",
+                    clicked_fn=lambda cid=collection.id: self._on_remove_from_collection_clicked(cid),
+                    tooltip="Remove selected objects from collection"
+                )
+                ui.Button(
+                    "Select",
+                    clicked_fn=lambda cid=collection.id: self._on_select_collection_members(cid),
+                    tooltip="Select all collection members"
+                )
+            
+            ui.Spacer(height=4)
+            
+            # Member list
+            ui.Label("Members:", style=Styles.LABEL_SECONDARY)
+            members = self._vm.get_collection_members(collection.id)
+            
+            self._members_frame = ui.ScrollingFrame(
+                height=100,
+                horizontal_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED,
+                vertical_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED,
+                style={"background_color": RenderSetupColors.MEMBERS_BG, "border_radius": 4}
+            )
+            with self._members_frame:
+                self._members_stack = ui.VStack(spacing=1)
+                with self._members_stack:
+                    if not members:
+                        ui.Label(
+                            "  No members",
+                            style=Styles.LABEL_SECONDARY
+                        )
+            self._members = members
+            self._members_built = 0
+            self._append_member_rows()
+            self._members_frame.set_scroll_y_changed_fn(self._on_members_scrolled)
+            
+            with ui.HStack(height=20):
+                ui.Label(f"View All ({len(members)})", style=Styles.LABEL_SECONDARY)
+                ui.Spacer()
+                ui.Button(
+                    "Select All",
+                    width=70,
+                    height=20,
+                    clicked_fn=lambda cid=collection.id: self._on_select_collection_members(cid)
+                )
+            
+            ui.Spacer(height=4)
+    
+    def _build_add_override_section(self, collection: Collection) -> None:
+        """Build the "Add Override" section (built on first draw)."""
+        with ui.VStack(spacing=Sizes.SPACING_SMALL):
+            ui.Spacer(height=4)
+            
+            # Override type
+            with ui.HStack(height=24):
+                ui.Label("Type:", width=80)
+                self._override_type_combo = ui.ComboBox(
+                    0, *self._vm.get_override_types()
+                )
+            
+            ui.Spacer(height=4)
+            
+            visibility, rendering, transform = self._add_override_buttons(collection.id)
+            
+            # Common attributes - Visibility
+            ui.Label("Visibility:", style=Styles.LABEL_SECONDARY_11)
+            with ui.HStack(height=22, spacing=4):
+                for attr, cb in visibility:
+                    ui.Button(
+                        attr['button_label'],
+                        height=20,
+                        clicked_fn=cb,
+                        tooltip=attr['description'],
+                        style=Styles.BUTTON_FONT_10
+                    )
+            
+            # Common attributes - Rendering
+            ui.Label("Rendering:", style=Styles.LABEL_SECONDARY_11)
+            with ui.VStack(spacing=2):
+                for attr, cb in rendering:
+                    ui.Button(
+                        attr['button_label'],
+                        height=20,
+                        clicked_fn=cb,
+                        tooltip=attr['description'],
+                        style=Styles.BUTTON_FONT_10
+                    )
+            
+            # Common attributes - Transform
+            ui.Label("Transform:", style=Styles.LABEL_SECONDARY_11)
+            with ui.HStack(height=22, spacing=4):
+                for attr, cb in transform:
+                    ui.Button(
+                        attr['button_label'],
+                        height=20,
+                        clicked_fn=cb,
+                        tooltip=attr['description'],
+                        style=Styles.BUTTON_FONT_10
+                    )
+            
+            ui.Spacer(height=8)
+            
+            # Custom attribute input
+            ui.Label("Custom Attribute:", style=Styles.LABEL_SECONDARY_11)
+            with ui.HStack(height=24, spacing=4):
+                self._custom_attr_field = ui.StringField()
+                self._custom_attr_field.model.set_value("")
+                ui.Button(
+                    "Add",
+                    width=50,
+                    height=22,
+                    clicked_fn=lambda cid=collection.id: self._on_add_custom_override(cid),
+                    tooltip="Add custom attribute override"
+                )
+            ui.Label(
+                "Enter attribute path (e.g., visibility, xformOp:translate)",
+                style=Styles.LABEL_SECONDARY_9
+            )
+            
+            ui.Spacer(height=4)
+            
+            # Get attributes from selection
+            ui.Button(
+                "Get Attributes from Selection...",
+                height=Sizes.BUTTON_HEIGHT,
+                clicked_fn=lambda cid=collection.id: self._on_show_prim_attributes(cid),
+                tooltip="Show attributes of selected prim"
+            )
+            
+            ui.Spacer(height=4)
+    
     def _build_override_properties(self) -> None:
         """Build property editor for an override."""
         # Find the override
@@ -810,14 +1057,14 @@ class RenderSetupView(BaseView):
                     # Name (read-only)
                     with ui.HStack(height=24):
                         ui.Label("Attribute:", width=80)
-                        ui.Label(override.name, style={"color": Colors.TEXT_PRIMARY})
+                        ui.Label(override.name, style=Styles.LABEL_NORMAL)
                     
                     # Type
                     with ui.HStack(height=24):
                         ui.Label("Type:", width=80)
                         ui.Label(
                             override.override_type.value,
-                            style={"color": 0xFFFFAA00 if override.override_type == OverrideType.ABSOLUTE else 0xFF00AAFF}
+                            style=_OVERRIDE_TYPE_LABEL_STYLE[override.override_type == OverrideType.ABSOLUTE]
                         )
                     
                     # Value
@@ -826,18 +1073,21 @@ class RenderSetupView(BaseView):
                         if isinstance(override.value, bool):
                             checkbox = ui.CheckBox(width=20)
                             checkbox.model.set_value(override.value)
+                            self._override_value_model = checkbox.model
                             checkbox.model.add_value_changed_fn(
                                 lambda m, oid=override.id: self._on_override_value_changed(oid, m.get_value_as_bool())
                             )
                         elif isinstance(override.value, (int, float)):
                             value_field = ui.FloatField()
                             value_field.model.set_value(float(override.value))
+                            self._override_value_model = value_field.model
                             value_field.model.add_value_changed_fn(
                                 lambda m, oid=override.id: self._on_override_value_changed(oid, m.get_value_as_float())
                             )
                         else:
                             value_field = ui.StringField()
                             value_field.model.set_value(str(override.value))
+                            self._override_value_model = value_field.model
                             value_field.model.add_end_edit_fn(
                                 lambda m, oid=override.id: self._on_override_value_changed(oid, m.get_value_as_string())
                             )
@@ -847,6 +1097,7 @@ class RenderSetupView(BaseView):
                         ui.Label("Enabled:", width=80)
                         enabled_checkbox = ui.CheckBox(width=20)
                         enabled_checkbox.model.set_value(override.enabled)
+                        self._override_enabled_model = enabled_checkbox.model
                         enabled_checkbox.model.add_value_changed_fn(
                             lambda m, oid=override.id: self._vm.set_override_enabled(oid, m.get_value_as_bool())
                         )
@@ -860,9 +1111,36 @@ class RenderSetupView(BaseView):
                     "Delete Override",
                     height=Sizes.BUTTON_HEIGHT,
                     clicked_fn=lambda cid=collection_id, oid=override.id: self._on_delete_override_clicked(cid, oid),
-                    style={"background_color": 0xFF8E3A3A}
+                    style=Styles.BUTTON_DANGER_BG
                 )
     
+    def _append_member_rows(self) -> None:
+        """Create the next page of member rows in the member list."""
+        if not self._members_stack:
+            return
+        start = self._members_built
+        end = min(start + RenderSetupSizes.MEMBER_PAGE_SIZE, len(self._members))
+        if start >= end:
+            return
+        with self._members_stack:
+            for member in self._members[start:end]:
+                ui.Label(
+                    f"  {member['name']}",
+                    height=RenderSetupSizes.MEMBER_ROW_HEIGHT,
+                    elided_text=True,
+                    tooltip=member['path'],
+                    style=Styles.LABEL_NORMAL_11
+                )
+        self._members_built = end
+    
+    def _on_members_scrolled(self, scroll_y: float) -> None:
+        """Load more member rows when the list is scrolled near its end."""
+        if not self._members_frame or self._members_built >= len(self._members):
+            return
+        threshold = RenderSetupSizes.MEMBER_ROW_HEIGHT * 4
+        if scroll_y >= self._members_frame.scroll_y_max - threshold:
+            self._append_member_rows()
+    
     # =========================================================================
     # Event Handlers - Toolbar
     # =========================================================================
@@ -873,6 +1151,8 @@ class RenderSetupView(BaseView):
     
     def _on_refresh_clicked(self) -> None:
         """Handle refresh button click."""
+        self._collection_add_cbs.clear()
+        self._last_property_key = None
         self._refresh_ui()
     
     # =========================================================================
@@ -994,48 +1274,69 @@ class RenderSetupView(BaseView):
         self._vm.delete_override(collection_id, override_id)
         self._vm.clear_selection()
     
-    def _on_add_common_override(self, collection_id: str, attr_info: Dict[str, Any]) -> None:
+    def _on_add_common_override(self, collection_id: str, attr_info: Mapping[str, Any]) -> None:
         """Handle adding a common override."""
-        override_type_idx = 0
-        if hasattr(self, '_override_type_combo'):
-            override_type_idx = self._override_type_combo.model.get_item_value_model().get_value_as_int()
+        override_type = self._selected_override_type()
         
-        override_types = self._vm.get_override_types()
-        override_type = OverrideType(override_types[override_type_idx])
+        # The attribute tables are shared; give each override its own vector
+        default_value = attr_info['default_value']
+        if isinstance(default_value, tuple):
+            default_value = list(default_value)
         
         self._vm.create_override(
             collection_id,
             attr_info['path'],
-            attr_info['default_value'],
+            default_value,
             override_type,
             attr_info['name']
         )
     
+    def _selected_override_type(self) -> OverrideType:
+        """Return the override type picked in the Add Override section."""
+        override_type_idx = 0
+        if self._override_type_combo is not None:
+            override_type_idx = self._override_type_combo.model.get_item_value_model().get_value_as_int()
+        return OverrideType(self._vm.get_override_types()[override_type_idx])
+    
+    def _add_override_buttons(self, collection_id: str) -> _AddOverrideGroups:
+        """
+        Return the (visibility, rendering, transform) "Add Override" groups of a collection.
+        
+        Each group holds (attribute, callback) pairs. They are bound once per
+        collection and reused on every rebuild of the section.
+        """
+        groups = self._collection_add_cbs.get(collection_id)
+        if groups is None:
+            groups = tuple(
+                tuple((attr, partial(self._on_add_common_override, collection_id, attr)) for attr in attrs)
+                for attrs in (
+                    self._vm.get_visibility_attributes(),
+                    self._vm.get_rendering_attributes(),
+                    self._vm.get_transform_attributes(),
+                )
+            )
+            self._collection_add_cbs[collection_id] = groups
+        return groups
+    
     def _on_add_custom_override(self, collection_id: str) -> None:
         """Handle adding a custom attribute override."""
-        if not hasattr(self, '_custom_attr_field'):
+        if self._custom_attr_field is None:
             return
         
         attr_path = self._custom_attr_field.model.get_value_as_string().strip()
         if not attr_path:
             return
         
-        override_type_idx = 0
-        if hasattr(self, '_override_type_combo'):
-            override_type_idx = self._override_type_combo.model.get_item_value_model().get_value_as_int()
-        
-        override_types = self._vm.get_override_types()
-        override_type = OverrideType(override_types[override_type_idx])
+        override_type = self._selected_override_type()
         
         # Determine default value based on common attribute names
         default_value: Any = True
         attr_lower = attr_path.lower()
-        if 'translate' in attr_lower or 'scale' in attr_lower or 'rotate' in attr_lower:
-            default_value = [0.0, 0.0, 0.0]
-        elif 'color' in attr_lower:
-            default_value = [1.0, 1.0, 1.0]
-        elif 'intensity' in attr_lower or 'exposure' in attr_lower:
-            default_value = 1.0
+        for pattern, value in _ATTR_DEFAULTS:
+            if pattern.search(attr_lower):
+                # Vector values are stored as lists on the override
+                default_value = list(value) if isinstance(value, tuple) else value
+                break
         
         # Use the last part of the path as the name
         attr_name = attr_path.split(":")[-1] if ":" in attr_path else attr_path
@@ -1063,13 +1364,19 @@ class RenderSetupView(BaseView):
     
     def _show_attributes_popup(self, collection_id: str, attrs: List[Dict[str, Any]]) -> None:
         """Show a popup window with prim attributes."""
-        # Create a simple popup window
+        # Only one attribute popup at a time
+        self._close_attributes_popup()
+        
         popup_window = ui.Window(
             "Select Attribute to Override",
             width=400,
             height=500,
             flags=ui.WINDOW_FLAGS_NO_COLLAPSE
         )
+        self._attrs_window = popup_window
+        self._attrs = [self._attribute_row_texts(attr) for attr in attrs]
+        self._attrs_built = 0
+        self._attrs_collection_id = collection_id
         
         with popup_window.frame:
             with ui.VStack(spacing=4):
@@ -1079,58 +1386,93 @@ class RenderSetupView(BaseView):
                 )
                 ui.Label(
                     "Click an attribute to add as override:",
-                    style={"font_size": 11, "color": Colors.TEXT_SECONDARY}
+                    style=Styles.LABEL_SECONDARY_11
                 )
                 
                 ui.Separator(height=4)
                 
-                with ui.ScrollingFrame(height=400):
-                    with ui.VStack(spacing=2):
-                        for attr in attrs[:100]:  # Limit to 100 attributes
-                            attr_name = attr.get('name', 'unknown')
-                            attr_value = attr.get('value', None)
-                            attr_type = attr.get('type', 'unknown')
-                            
-                            # Format value for display
-                            value_str = str(attr_value)[:30] if attr_value is not None else "None"
-                            
-                            with ui.HStack(height=22):
-                                ui.Button(
-                                    f"+ {attr_name}",
-                                    width=150,
-                                    height=20,
-                                    clicked_fn=lambda a=attr, cid=collection_id, w=popup_window: self._add_attr_and_close(cid, a, w),
-                                    style={"font_size": 10}
-                                )
-                                ui.Label(
-                                    f"= {value_str}",
-                                    style={"font_size": 10, "color": Colors.TEXT_SECONDARY}
-                                )
-                                ui.Label(
-                                    f"({attr_type})",
-                                    width=80,
-                                    style={"font_size": 9, "color": 0xFF808080}
-                                )
+                self._attrs_frame = ui.ScrollingFrame(height=400)
+                with self._attrs_frame:
+                    self._attrs_stack = ui.VStack(spacing=2)
+                self._append_attribute_rows()
+                self._attrs_frame.set_scroll_y_changed_fn(self._on_attributes_scrolled)
                 
                 ui.Separator(height=4)
                 
                 ui.Button(
                     "Close",
                     height=26,
-                    clicked_fn=lambda w=popup_window: w.destroy()
+                    clicked_fn=self._close_attributes_popup
                 )
     
-    def _add_attr_and_close(self, collection_id: str, attr: Dict[str, Any], window: ui.Window) -> None:
+    def _append_attribute_rows(self) -> None:
+        """Create the next page of rows in the attribute popup."""
+        if not self._attrs_stack:
+            return
+        start = self._attrs_built
+        end = min(start + RenderSetupSizes.ATTR_PAGE_SIZE, len(self._attrs))
+        if start >= end:
+            return
+        with self._attrs_stack:
+            for button_text, value_text, type_text, attr in self._attrs[start:end]:
+                with ui.HStack(height=RenderSetupSizes.ATTR_ROW_HEIGHT):
+                    ui.Button(
+                        button_text,
+                        width=150,
+                        height=20,
+                        clicked_fn=partial(self._add_attr_and_close, self._attrs_collection_id, attr),
+                        style=Styles.BUTTON_FONT_10
+                    )
+                    ui.Label(
+                        value_text,
+                        style=Styles.LABEL_SECONDARY_10
+                    )
+                    ui.Label(
+                        type_text,
+                        width=80,
+                        style=Styles.LABEL_MUTED_9
+                    )
+        self._attrs_built = end
+    
+    @staticmethod
+    def _attribute_row_texts(attr: Dict[str, Any]) -> Tuple[str, str, str, Dict[str, Any]]:
+        """Format the (button, value, type) texts of an attribute popup row."""
+        attr_value = attr.get('value', None)
+        # Values are truncated for display
+        value_str = str(attr_value)[:30] if attr_value is not None else "None"
+        return (
+            f"+ {attr.get('name', 'unknown')}",
+            f"= {value_str}",
+            f"({attr.get('type', 'unknown')})",
+            attr,
+        )
+    
+    def _on_attributes_scrolled(self, scroll_y: float) -> None:
+        """Load more attribute rows when the popup is scrolled near its end."""
+        if not self._attrs_frame or self._attrs_built >= len(self._attrs):
+            return
+        threshold = RenderSetupSizes.ATTR_ROW_HEIGHT * 4
+        if scroll_y >= self._attrs_frame.scroll_y_max - threshold:
+            self._append_attribute_rows()
+    
+    def _close_attributes_popup(self) -> None:
+        """Destroy the attribute popup, if open, and drop its rows."""
+        window = self._attrs_window
+        self._attrs_window = None
+        self._attrs_frame = None
+        self._attrs_stack = None
+        self._attrs = []
+        self._attrs_built = 0
+        self._attrs_collection_id = None
+        if window:
+            window.destroy()
+    
+    def _add_attr_and_close(self, collection_id: str, attr: Dict[str, Any]) -> None:
         """Add an attribute as override and close the popup."""
         attr_name = attr.get('name', 'unknown')
         attr_value = attr.get('value', True)
         
-        override_type_idx = 0
-        if hasattr(self, '_override_type_combo'):
-            override_type_idx = self._override_type_combo.model.get_item_value_model().get_value_as_int()
-        
-        override_types = self._vm.get_override_types()
-        override_type = OverrideType(override_types[override_type_idx])
+        override_type = self._selected_override_type()
         
         self._vm.create_override(
             collection_id,
@@ -1140,7 +1482,7 @@ class RenderSetupView(BaseView):
             attr_name
         )
         
-        window.destroy()
+        self._close_attributes_popup()
     
     # =========================================================================
     # Utility Methods
@@ -1148,76 +1490,172 @@ class RenderSetupView(BaseView):
     
     def _find_layer_for_collection(self, collection_id: str) -> Optional[str]:
         """Find the layer ID that contains a collection."""
-        for layer in self._vm.layers:
-            if layer.find_collection(collection_id):
-                return layer.id
-        return None
+        return self._vm.find_layer_for_collection(collection_id)
     
     def _find_override_by_id(self, override_id: str) -> Optional[Override]:
         """Find an override by ID."""
-        for layer in self._vm.layers:
-            for col in layer.collections:
-                override = self._search_override_in_collection(col, override_id)
-                if override:
-                    return override
-        return None
-    
-    def _search_override_in_collection(self, collection: Collection, override_id: str) -> Optional[Override]:
-        """Recursively search for an override in a collection."""
-        for ovr in collection.overrides:
-            if ovr.id == override_id:
-                return ovr
-        for sub in collection.sub_collections:
-            found = self._search_override_in_collection(sub, override_id)
-            if found:
-                return found
-        return None
+        return self._vm.find_override(override_id)
     
     def _find_collection_for_override(self, override_id: str) -> Optional[str]:
         """Find the collection ID that contains an override."""
-        for layer in self._vm.layers:
-            for col in layer.collections:
-                cid = self._search_collection_for_override(col, override_id)
-                if cid:
-                    return cid
-        return None
-    
-    def _search_collection_for_override(self, collection: Collection, override_id: str) -> Optional[str]:
-        """Recursively search for the collection containing an override."""
-        for ovr in collection.overrides:
-            if ovr.id == override_id:
-                return collection.id
-        for sub in collection.sub_collections:
-            cid = self._search_collection_for_override(sub, override_id)
-            if cid:
-                return cid
-        return None
+        return self._vm.find_collection_for_override(override_id)
     
-    # =========================================================================
-    # UI Refresh
-    # =========================================================================
+    def _schedule_refresh(self) -> None:
+        """
+        Request a UI refresh on the next update tick.
+        
+        Several ViewModel mutations in a row (e.g. adding a batch of
+        overrides) collapse into a single rebuild. Deferring also keeps
+        ``Container.clear()`` out of widget event callbacks.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        asyncio.ensure_future(self._deferred_refresh())
+    
+    async def _deferred_refresh(self) -> None:
+        """Wait one update tick, then run the pending refresh."""
+        try:
+            import omni.kit.app
+            await omni.kit.app.get_app().next_update_async()
+        finally:
+            self._refresh_pending = False
+        # The view may have been disposed while waiting
+        if self._tree_container is None:
+            return
+        self._refresh_ui()
     
     def _refresh_ui(self) -> None:
-        """Refresh the entire UI."""
-        # Rebuild tree
-        if self._tree_container:
-            self._tree_container.clear()
-            with self._tree_container:
-                self._build_tree_content()
+        """
+        Refresh the data-dependent parts of the UI.
         
-        # Rebuild property panel
+        Data change notifications go through ``_schedule_refresh``; the
+        toolbar Refresh button calls this directly so it takes effect in
+        the same frame.
+        
+        Only the tree rows and the property panel track ViewModel data. The
+        toolbar and Scene section are built once in ``build()`` and are never
+        touched here.
+        """
+        # Rebind tree rows
+        self._build_tree_content()
+        
+        # Drop Add Override callbacks of collections that no longer exist
+        # (deleted directly, with their layer, by clear_all or by an import)
+        stale = [cid for cid in self._collection_add_cbs if self._vm.find_layer_for_collection(cid) is None]
+        for cid in stale:
+            del self._collection_add_cbs[cid]
+        
+        # Rebuild property panel (only if the selection or its fields changed)
         if self._property_container:
+            property_key = self._property_key()
+            if property_key == self._last_property_key:
+                self._patch_override_properties()
+                return
+            self._last_property_key = property_key
+            self._reset_member_list()
+            self._override_value_model = None
+            self._override_enabled_model = None
+            self._override_type_combo = None
+            self._custom_attr_field = None
             self._property_container.clear()
             with self._property_container:
                 self._build_property_content()
     
+    def _patch_override_properties(self) -> None:
+        """
+        Push the selected override's value and enabled state into the open panel.
+        
+        These two fields are left out of ``_property_key``, so editing them
+        (from the panel or the tree) updates the existing widgets instead of
+        rebuilding the panel under the user's cursor.
+        """
+        if not self._override_value_model:
+            return
+        selected_id, _ = self._vm.selected_item
+        override = self._find_override_by_id(selected_id)
+        if not override:
+            return
+        
+        value = override.value
+        model = self._override_value_model
+        if isinstance(value, bool):
+            current = model.get_value_as_bool()
+        elif isinstance(value, (int, float)):
+            current, value = model.get_value_as_float(), float(value)
+        else:
+            current, value = model.get_value_as_string(), str(value)
+        # Only write on a real change, the models call back into the ViewModel
+        if current != value:
+            model.set_value(value)
+        
+        if self._override_enabled_model.get_value_as_bool() != override.enabled:
+            self._override_enabled_model.set_value(override.enabled)
+    
+    def _property_key(self) -> Tuple:
+        """
+        Build a key describing what the property panel currently displays.
+        
+        The key combines the selection with the selected entity's displayed
+        fields, so unrelated data changes leave the panel untouched.
+        """
+        selected_id, selected_type = self._vm.selected_item
+        fields: Optional[Tuple] = None
+        
+        if selected_type == "layer":
+            layer = self._vm.selected_layer
+            if layer:
+                fields = (layer.name, layer.color, layer.isolate_mode)
+        elif selected_type == "collection":
+            collection = self._vm.selected_collection
+            if collection:
+                fields = (
+                    collection.name,
+                    collection.filter_type,
+                    collection.expression,
+                    tuple(collection.include_paths),
+                    tuple(collection.exclude_paths),
+                )
+        elif selected_type == "override":
+            override = self._find_override_by_id(selected_id)
+            if override:
+                # Value and enabled are patched in place (see
+                # _patch_override_properties); only the value's kind picks
+                # the editor widget.
+                fields = (
+                    override.name,
+                    override.override_type,
+                    bool if isinstance(override.value, bool)
+                    else float if isinstance(override.value, (int, float))
+                    else str,
+                )
+        
+        return (selected_id, selected_type, fields)
+    
+    def _reset_member_list(self) -> None:
+        """Drop references to the current collection member list."""
+        self._members_frame = None
+        self._members_stack = None
+        self._members = []
+        self._members_built = 0
+    
     # =========================================================================
     # Lifecycle
     # =========================================================================
     
     def dispose(self) -> None:
         """Clean up resources."""
-        self._vm.remove_data_changed_callback(self._refresh_ui)
+        self._vm.remove_data_changed_callback(self._schedule_refresh)
+        self._reset_member_list()
+        self._close_attributes_popup()
+        self._override_value_model = None
+        self._override_enabled_model = None
+        self._override_type_combo = None
+        self._custom_attr_field = None
+        self._collection_add_cbs.clear()
+        self._swatch_provider = None
+        self._row_slots = []
+        self._tree_empty_label = None
         self._tree_container = None
         self._property_container = None
         self._scene_frame = None
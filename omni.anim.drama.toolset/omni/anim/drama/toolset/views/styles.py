@@ -21,11 +21,14 @@ class Colors:
     WARNING = 0xFFFFAA00          # 警告 - 橙色
     ERROR = 0xFFFF4444            # 错误 - 红色
     INFO = 0xFF00AAFF             # 信息 - 浅蓝色
+    DANGER_BG = 0xFF8E3A3A        # 危险操作按钮背景 - 暗红色
 
     # 中性色
     TEXT_PRIMARY = 0xFFE0E0E0     # 主要文字
     TEXT_SECONDARY = 0xFFA0A0A0   # 次要文字
     TEXT_DISABLED = 0xFF606060    # 禁用文字
+    TEXT_MUTED = 0xFF808080       # 弱化文字
+    TEXT_WHITE = 0xFFFFFFFF       # 纯白文字（高亮图标）
 
     BACKGROUND = 0xFF303030       # 背景色
     BACKGROUND_LIGHT = 0xFF404040 # 浅背景
@@ -89,10 +92,22 @@ class Styles:
         "color": Colors.WARNING,
     }
 
+    BUTTON_INFO = {
+        "color": Colors.INFO,
+    }
+
     BUTTON_DANGER = {
         "color": Colors.ERROR,
     }
 
+    BUTTON_DANGER_BG = {
+        "background_color": Colors.DANGER_BG,
+    }
+
+    BUTTON_FONT_10 = {
+        "font_size": 10,
+    }
+
     # =========================================================================
     # 输入框样式
     # =========================================================================
@@ -122,10 +137,47 @@ class Styles:
         "color": Colors.TEXT_PRIMARY,
     }
 
+    LABEL_NORMAL_11 = {
+        "color": Colors.TEXT_PRIMARY,
+        "font_size": 11,
+    }
+
     LABEL_SECONDARY = {
         "color": Colors.TEXT_SECONDARY,
     }
 
+    LABEL_SUCCESS = {
+        "color": Colors.SUCCESS,
+    }
+
+    LABEL_WARNING = {
+        "color": Colors.WARNING,
+    }
+
+    LABEL_INFO = {
+        "color": Colors.INFO,
+    }
+
+    LABEL_SECONDARY_11 = {
+        "color": Colors.TEXT_SECONDARY,
+        "font_size": 11,
+    }
+
+    LABEL_SECONDARY_10 = {
+        "color": Colors.TEXT_SECONDARY,
+        "font_size": 10,
+    }
+
+    LABEL_SECONDARY_9 = {
+        "color": Colors.TEXT_SECONDARY,
+        "font_size": 9,
+    }
+
+    LABEL_MUTED_9 = {
+        "color": Colors.TEXT_MUTED,
+        "font_size": 9,
+    }
+
     LABEL_PATH = {
         "color": Colors.TEXT_SECONDARY,
         "word_wrap": True,
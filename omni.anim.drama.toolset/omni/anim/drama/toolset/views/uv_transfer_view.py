@@ -11,12 +11,25 @@ UV 传输视图
     - 执行 UV 烘焙
 """
 
+import asyncio
+
 import omni.ui as ui
 
 from .base_view import BaseView
-from .styles import Styles, Sizes, Colors
+from .styles import Styles, Sizes
 from ..viewmodels.uv_transfer_vm import UVTransferViewModel
 
+# 文件对话框为可选依赖，模块加载时探测一次
+try:
+    from omni.kit.window.filepicker import FilePickerDialog as _FilePickerDialog
+except ImportError:
+    _FilePickerDialog = None
+
+try:
+    import omni.kit.window.file as _file_dlg
+except ImportError:
+    _file_dlg = None
+
 
 class UVTransferView(BaseView):
     """
@@ -46,6 +59,9 @@ class UVTransferView(BaseView):
         self._pairs_list_field = None
         self._pairs_count_label = None
 
+        # 同一帧内的多次数据变更合并为一次刷新
+        self._refresh_pending = False
+
         # 绑定数据变更
         self._vm.add_data_changed_callback(self._refresh_display)
 
@@ -123,19 +139,23 @@ class UVTransferView(BaseView):
         with ui.HStack():
             ui.Label("Output file:", width=Sizes.LABEL_WIDTH + 60)
             self._out_field = ui.StringField()
+            self._out_field.model.set_value(self._vm.output_path)
             ui.Button(
                 "Browse…",
                 width=90,
                 clicked_fn=self._on_browse_clicked
             )
 
+        # 监听变化
+        self._out_field.model.add_value_changed_fn(self._on_output_changed)
+
     # =========================================================================
     # UI 构建：操作按钮部分
     # =========================================================================
 
     def _build_action_button(self) -> None:
         """构建操作按钮区域。"""
-        ui.Label("Single Bake:", style={"color": Colors.TEXT_SECONDARY})
+        ui.Label("Single Bake:", style=Styles.LABEL_SECONDARY)
         ui.Button(
             "Bake (reloc-safe) → final.usd[a/c]",
             height=Sizes.BUTTON_HEIGHT_LARGE,
@@ -146,7 +166,7 @@ class UVTransferView(BaseView):
         ui.Button(
             "Bake (standalone) → No Dependencies",
             height=Sizes.BUTTON_HEIGHT_LARGE,
-            style={"color": Colors.INFO},
+            style=Styles.BUTTON_INFO,
             clicked_fn=self._on_bake_standalone_clicked
         )
 
@@ -155,62 +175,75 @@ class UVTransferView(BaseView):
     # =========================================================================
 
     def _build_batch_section(self) -> None:
-        """构建批量处理区域。"""
-        with ui.CollapsableFrame("Batch Processing", collapsed=True):
-            with ui.VStack(spacing=Sizes.SPACING_SMALL):
-                # 说明
-                ui.Label(
-                    "Add multiple Source-Target pairs to process in batch",
-                    style={"color": Colors.TEXT_SECONDARY}
-                )
-
-                # 添加按钮
-                with ui.HStack(height=Sizes.BUTTON_HEIGHT):
-                    ui.Button(
-                        "Add Current Pair to List",
-                        clicked_fn=self._on_add_pair_clicked
-                    )
-                    ui.Button(
-                        "Clear List",
-                        width=100,
-                        clicked_fn=self._on_clear_pairs_clicked
-                    )
-
-                # 对数显示
-                with ui.HStack(height=24):
-                    ui.Label("Pairs in list:", width=100)
-                    self._pairs_count_label = ui.Label(
-                        "0",
-                        style={"color": Colors.WARNING}
-                    )
-
-                # 列表显示
-                ui.Label("Pairs List:", style={"color": Colors.TEXT_SECONDARY})
-                self._pairs_list_field = ui.StringField(
-                    multiline=True,
-                    height=80,
-                    read_only=True
-                )
-                self._pairs_list_field.model.set_value("(empty)")
+        """构建批量处理区域（内容在首次展开时才创建）。"""
+        ui.CollapsableFrame(
+            "Batch Processing",
+            collapsed=True,
+            build_fn=self._build_batch_contents
+        )
 
-                ui.Spacer(height=4)
+    def _build_batch_contents(self) -> None:
+        """构建批量处理区域的内容。"""
+        with ui.VStack(spacing=Sizes.SPACING_SMALL):
+            # 说明
+            ui.Label(
+                "Add multiple Source-Target pairs to process in batch",
+                style=Styles.LABEL_SECONDARY
+            )
 
-                # 批量执行按钮
-                ui.Label("Batch Bake:", style={"color": Colors.TEXT_SECONDARY})
+            # 添加按钮
+            with ui.HStack(height=Sizes.BUTTON_HEIGHT):
                 ui.Button(
-                    "Batch Bake All (reloc-safe)",
-                    height=Sizes.BUTTON_HEIGHT_LARGE,
-                    style=Styles.BUTTON_SUCCESS,
-                    clicked_fn=self._on_batch_bake_clicked
+                    "Add Current Pair to List",
+                    clicked_fn=self._on_add_pair_clicked
                 )
-                ui.Spacer(height=4)
                 ui.Button(
-                    "Batch Bake All (standalone)",
-                    height=Sizes.BUTTON_HEIGHT_LARGE,
-                    style={"color": Colors.INFO},
-                    clicked_fn=self._on_batch_bake_standalone_clicked
+                    "Add Selected as Targets",
+                    tooltip="Pair the current Source with every selected prim",
+                    clicked_fn=self._on_add_selected_targets_clicked
+                )
+                ui.Button(
+                    "Clear List",
+                    width=100,
+                    clicked_fn=self._on_clear_pairs_clicked
                 )
 
+            # 对数显示
+            with ui.HStack(height=24):
+                ui.Label("Pairs in list:", width=100)
+                count = self._vm.pairs_count
+                self._pairs_count_label = ui.Label(
+                    str(count),
+                    style=Styles.LABEL_SUCCESS if count > 0 else Styles.LABEL_WARNING
+                )
+
+            # 列表显示
+            ui.Label("Pairs List:", style=Styles.LABEL_SECONDARY)
+            self._pairs_list_field = ui.StringField(
+                multiline=True,
+                height=80,
+                read_only=True
+            )
+            self._pairs_list_field.model.set_value(self._vm.pairs_display_text or "(empty)")
+
+            ui.Spacer(height=4)
+
+            # 批量执行按钮
+            ui.Label("Batch Bake:", style=Styles.LABEL_SECONDARY)
+            ui.Button(
+                "Batch Bake All (reloc-safe)",
+                height=Sizes.BUTTON_HEIGHT_LARGE,
+                style=Styles.BUTTON_SUCCESS,
+                clicked_fn=self._on_batch_bake_clicked
+            )
+            ui.Spacer(height=4)
+            ui.Button(
+                "Batch Bake All (standalone)",
+                height=Sizes.BUTTON_HEIGHT_LARGE,
+                style=Styles.BUTTON_INFO,
+                clicked_fn=self._on_batch_bake_standalone_clicked
+            )
+
     # =========================================================================
     # 事件处理
     # =========================================================================
@@ -230,29 +263,25 @@ class UVTransferView(BaseView):
         """Primvar 名称变化处理。"""
         self._vm.primvar_name = model.get_value_as_string()
 
+    def _on_output_changed(self, model) -> None:
+        """输出路径变化处理。"""
+        self._vm.sync_output_path(model.get_value_as_string())
+
     def _on_browse_clicked(self) -> None:
         """浏览按钮点击，打开文件选择对话框。"""
         try:
             base_dir = self._vm.get_stage_base_dir()
             default_name = "final_hair.usda"
 
-            def _apply(filename, dirname):
-                try:
-                    if not filename.lower().endswith((".usda", ".usd", ".usdc")):
-                        filename += ".usda"
-                    path = f"{dirname}/{filename}".replace("\\", "/")
-                    self._vm.set_output_path(path)
-                    if self._out_field:
-                        self._out_field.model.set_value(path)
-                finally:
-                    self._close_picker()
-
-            # 尝试使用 FilePickerDialog
-            try:
-                from omni.kit.window.filepicker import FilePickerDialog
-                self._picker = FilePickerDialog(
+            # 尝试使用 FilePickerDialog（首次创建，之后复用同一个对话框）
+            if _FilePickerDialog is not None:
+                if self._picker is not None:
+                    self._picker.set_filename(default_name)
+                    self._picker.show(base_dir)
+                    return
+                self._picker = _FilePickerDialog(
                     "Save Final USD",
-                    click_apply_handler=_apply,
+                    click_apply_handler=self._apply_browse,
                     apply_button_label="Save",
                     enable_directory_change=True,
                     starting_path=base_dir,
@@ -264,26 +293,43 @@ class UVTransferView(BaseView):
                     ],
                 )
                 return
-            except ImportError:
-                self._picker = None
 
             # 回退到简单文件对话框
+            if _file_dlg is None:
+                self._vm.log("File dialog unavailable, please type path manually.")
+                return
             try:
-                import omni.kit.window.file as file_dlg
-                dlg = file_dlg.FileDialog(
+                dlg = _file_dlg.FileDialog(
                     title="Save Final USD",
                     allow_multi_selection=False,
                     apply_button_label="Save"
                 )
-                dlg.show(lambda path: self._on_file_selected(path))
+                dlg.show(self._on_file_selected)
             except Exception as e:
                 self._vm.log(f"File dialog unavailable, please type path manually. ({e})")
 
         except Exception as e:
             self._vm.log(f"Browse error: {e}")
 
+    def _apply_browse(self, filename: str, dirname: str) -> None:
+        """FilePickerDialog 的保存回调。"""
+        try:
+            if not filename.lower().endswith((".usda", ".usd", ".usdc")):
+                filename += ".usda"
+            self._on_file_selected(f"{dirname}/{filename}")
+        finally:
+            self._close_picker()
+
     def _close_picker(self) -> None:
-        """关闭文件选择器。"""
+        """隐藏文件选择器（保留实例供下次打开复用）。"""
+        if self._picker:
+            try:
+                self._picker.hide()
+            except Exception:
+                pass
+
+    def _destroy_picker(self) -> None:
+        """销毁文件选择器。"""
         if self._picker:
             try:
                 self._picker.hide()
@@ -304,19 +350,11 @@ class UVTransferView(BaseView):
 
     def _on_bake_clicked(self) -> None:
         """烘焙按钮点击。"""
-        # 获取输出路径
-        if self._out_field:
-            self._vm.output_path = self._out_field.model.get_value_as_string()
-
         # 执行烘焙
         self._vm.run_bake()
 
     def _on_bake_standalone_clicked(self) -> None:
         """独立烘焙按钮点击。"""
-        # 获取输出路径
-        if self._out_field:
-            self._vm.output_path = self._out_field.model.get_value_as_string()
-
         # 执行独立烘焙
         self._vm.run_bake_standalone()
 
@@ -324,16 +362,16 @@ class UVTransferView(BaseView):
         """添加对到列表按钮点击。"""
         self._vm.add_current_pair()
 
+    def _on_add_selected_targets_clicked(self) -> None:
+        """把选中的 prim 作为 Target 批量添加按钮点击。"""
+        self._vm.add_selected_targets()
+
     def _on_clear_pairs_clicked(self) -> None:
         """清空列表按钮点击。"""
         self._vm.clear_pairs_list()
 
     def _on_batch_bake_clicked(self) -> None:
         """批量烘焙按钮点击。"""
-        # 获取输出路径
-        if self._out_field:
-            self._vm.output_path = self._out_field.model.get_value_as_string()
-
         # 执行批量烘焙
         success, fail, errors = self._vm.run_batch_bake(standalone=False)
         if errors:
@@ -342,10 +380,6 @@ class UVTransferView(BaseView):
 
     def _on_batch_bake_standalone_clicked(self) -> None:
         """批量独立烘焙按钮点击。"""
-        # 获取输出路径
-        if self._out_field:
-            self._vm.output_path = self._out_field.model.get_value_as_string()
-
         # 执行批量独立烘焙
         success, fail, errors = self._vm.run_batch_bake(standalone=True)
         if errors:
@@ -357,31 +391,58 @@ class UVTransferView(BaseView):
     # =========================================================================
 
     def _refresh_display(self) -> None:
-        """刷新显示数据。"""
-        if self._src_label:
-            self._src_label.text = self._vm.source_curve
+        """
+        请求在下一帧刷新显示数据。
 
-        if self._tgt_field:
-            self._tgt_field.model.set_value(self._vm.target_root)
+        连续的 ViewModel 变更（如批量添加、烘焙过程中的更新）
+        只触发一次刷新。
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        asyncio.ensure_future(self._deferred_refresh())
 
-        if self._out_field:
-            self._out_field.model.set_value(self._vm.output_path)
+    async def _deferred_refresh(self) -> None:
+        """等待一帧后执行刷新。"""
+        try:
+            import omni.kit.app
+            await omni.kit.app.get_app().next_update_async()
+        finally:
+            self._refresh_pending = False
+        self._update_display()
+
+    def _update_display(self) -> None:
+        """
+        把 ViewModel 数据写入界面。
+
+        只写入与界面当前内容不同的值：model.set_value 即使值相同
+        也会触发监听器和重新布局。
+        """
+        if self._src_label:
+            source = self._vm.source_curve
+            if self._src_label.text != source:
+                self._src_label.text = source
+
+        self._set_field_value(self._tgt_field, self._vm.target_root)
+        self._set_field_value(self._out_field, self._vm.output_path)
 
         # 更新批量处理列表显示
         if self._pairs_count_label:
-            count = self._vm.pairs_count
-            self._pairs_count_label.text = str(count)
-            if count > 0:
-                self._pairs_count_label.style = {"color": Colors.SUCCESS}
-            else:
-                self._pairs_count_label.style = {"color": Colors.WARNING}
-
-        if self._pairs_list_field:
-            display_list = self._vm.get_pairs_display_list()
-            if display_list:
-                self._pairs_list_field.model.set_value("\n".join(display_list))
-            else:
-                self._pairs_list_field.model.set_value("(empty)")
+            count_text = str(self._vm.pairs_count)
+            if self._pairs_count_label.text != count_text:
+                self._pairs_count_label.text = count_text
+                if count_text != "0":
+                    self._pairs_count_label.style = Styles.LABEL_SUCCESS
+                else:
+                    self._pairs_count_label.style = Styles.LABEL_WARNING
+
+        self._set_field_value(self._pairs_list_field, self._vm.pairs_display_text or "(empty)")
+
+    @staticmethod
+    def _set_field_value(field, value: str) -> None:
+        """仅在内容变化时写入 StringField。"""
+        if field and field.model.get_value_as_string() != value:
+            field.model.set_value(value)
 
     # =========================================================================
     # 生命周期
@@ -390,7 +451,7 @@ class UVTransferView(BaseView):
     def dispose(self) -> None:
         """清理资源。"""
         self._vm.remove_data_changed_callback(self._refresh_display)
-        self._close_picker()
+        self._destroy_picker()
         self._src_label = None
         self._tgt_field = None
         self._pv_field = None